@@ -1,38 +1,126 @@
 """Audio device management for microphone selection."""
 import sounddevice as sd
-from typing import List, Dict, Optional
+import threading
+from typing import List, Dict, Optional, Tuple
 
 
 class DeviceManager:
     """Manages audio input devices."""
 
-    def __init__(self):
+    def __init__(self, background: bool = False):
+        """Initialize the device manager and enumerate devices.
+
+        Args:
+            background: Enumerate on a worker thread so startup can carry on;
+                the first device query waits for it to finish.
+        """
+        # PortAudio enumeration is slow, so it is done once and only redone
+        # by an explicit rescan()
         self._devices = None
-        self._refresh_devices()
+        self._input_devices: Optional[Tuple[Dict, ...]] = None
+        self._prefetch: Optional[threading.Thread] = None
+        # Failure of the background enumeration, raised by the first query
+        # if enumerating again fails too
+        self._prefetch_error: Optional[Exception] = None
+        # Held while a device test stream is open; rescan() restarts PortAudio,
+        # which must not happen under an open stream
+        self._stream_lock = threading.Lock()
+        if background:
+            self._prefetch = threading.Thread(
+                target=self._prefetch_devices, name="device-prefetch", daemon=True
+            )
+            self._prefetch.start()
+        else:
+            self._refresh_devices()
+
+    def _prefetch_devices(self):
+        """Enumerate devices on the prefetch thread."""
+        try:
+            self._refresh_devices()
+        except Exception as e:
+            # Retried synchronously by the first query
+            self._prefetch_error = e
+
+    def _wait_for_devices(self):
+        """Wait for a pending background enumeration, enumerating now if it failed.
+
+        Raises:
+            Exception: Enumeration failed again; chained to the background
+                failure when there was one.
+        """
+        if self._prefetch is not None:
+            self._prefetch.join()
+            self._prefetch = None
+        if self._devices is None:
+            prefetch_error, self._prefetch_error = self._prefetch_error, None
+            try:
+                self._refresh_devices()
+            except Exception as e:
+                raise e from prefetch_error
 
     def _refresh_devices(self):
         """Refresh the list of available audio devices."""
-        self._devices = sd.query_devices()
+        self._devices = tuple(sd.query_devices())
+        self._input_devices = tuple(
+            self._device_info(idx, device)
+            for idx, device in enumerate(self._devices)
+            if device['max_input_channels'] > 0
+        )
+
+    def rescan(self, stream_active: bool = False):
+        """Re-enumerate audio devices (e.g. after plugging in a microphone).
 
-    def get_input_devices(self) -> List[Dict]:
+        PortAudio fixes its device list when it initializes, so it is
+        restarted before querying.
+
+        Args:
+            stream_active: Whether the caller has an audio stream open.
+
+        Raises:
+            RuntimeError: A stream is open (the caller's or a device test).
+        """
+        self._wait_for_devices()
+        if stream_active or not self._stream_lock.acquire(blocking=False):
+            raise RuntimeError("Stop recording or testing the microphone before rescanning")
+        try:
+            sd._terminate()
+            sd._initialize()
+            self._refresh_devices()
+        finally:
+            self._stream_lock.release()
+
+    @staticmethod
+    def _device_info(idx: int, device) -> Dict:
+        """Build the info dictionary for a device.
+
+        Args:
+            idx: Device index.
+            device: Device description from sounddevice.
+
+        Returns:
+            Dictionary containing device info.
+        """
+        return {
+            'index': idx,
+            'name': device['name'],
+            'channels': device['max_input_channels'],
+            'sample_rate': device['default_samplerate']
+        }
+
+    def get_input_devices(self, use_cache: bool = True) -> List[Dict]:
         """Get list of available input devices.
 
+        Args:
+            use_cache: Serve the cached enumeration; False re-enumerates first.
+
         Returns:
             List of dictionaries containing device info.
         """
-        if self._devices is None:
+        self._wait_for_devices()
+        if not use_cache:
             self._refresh_devices()
 
-        input_devices = []
-        for idx, device in enumerate(self._devices):
-            if device['max_input_channels'] > 0:
-                input_devices.append({
-                    'index': idx,
-                    'name': device['name'],
-                    'channels': device['max_input_channels'],
-                    'sample_rate': device['default_samplerate']
-                })
-        return input_devices
+        return list(self._input_devices)
 
     def get_default_input_device(self) -> Optional[Dict]:
         """Get the default input device.
@@ -41,17 +129,17 @@ class DeviceManager:
             Dictionary containing default device info, or None if not found.
         """
         try:
+            self._wait_for_devices()
             default_idx = sd.default.device[0]
             if default_idx is None:
                 return None
 
-            device = sd.query_devices(default_idx)
-            return {
-                'index': default_idx,
-                'name': device['name'],
-                'channels': device['max_input_channels'],
-                'sample_rate': device['default_samplerate']
-            }
+            # Serve from the cached enumeration instead of querying PortAudio
+            if 0 <= default_idx < len(self._devices):
+                device = self._devices[default_idx]
+            else:
+                device = sd.query_devices(default_idx)
+            return self._device_info(default_idx, device)
         except Exception:
             return None
 
@@ -76,14 +164,15 @@ class DeviceManager:
             Recorded audio data if successful, None otherwise.
         """
         try:
-            recording = sd.rec(
-                int(duration * sample_rate),
-                samplerate=sample_rate,
-                channels=1,
-                device=device_index,
-                dtype='float32'
-            )
-            sd.wait()
+            with self._stream_lock:
+                recording = sd.rec(
+                    int(duration * sample_rate),
+                    samplerate=sample_rate,
+                    channels=1,
+                    device=device_index,
+                    dtype='float32'
+                )
+                sd.wait()
             return recording
         except Exception as e:
             print(f"Device test failed: {e}")
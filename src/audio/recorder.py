@@ -4,27 +4,71 @@ import soundfile as sf
 import numpy as np
 from typing import Optional, Callable
 from pathlib import Path
+import tempfile
 import threading
+import time
 
 
 class AudioRecorder:
     """Handles audio recording with pause/resume capability."""
 
-    def __init__(self, sample_rate: int = 44100, channels: int = 1):
+    # Maximum rate at which the level callback fires (meters don't need more)
+    LEVEL_UPDATE_HZ = 30
+
+    # Initial capture buffer length; it doubles whenever a take outgrows it
+    INITIAL_BUFFER_SECONDS = 60
+
+    # Default cap on a single take; capture stops when a take reaches it
+    DEFAULT_MAX_SECONDS = 30 * 60
+
+    # Takes longer than this move to a temp-file-backed buffer the OS can page out
+    MEMORY_BUFFER_SECONDS = 5 * 60
+
+    # Fill fraction at which the buffer is enlarged ahead of time, off the
+    # audio thread
+    GROW_AT_FILL = 0.5
+
+    def __init__(self, sample_rate: int = 44100, channels: int = 1,
+                 max_seconds: Optional[float] = DEFAULT_MAX_SECONDS):
         """Initialize the audio recorder.
 
         Args:
             sample_rate: Sample rate in Hz (default: 44100).
             channels: Number of audio channels (default: 1 for mono).
+            max_seconds: Longest take to capture (None for no limit). When a
+                take reaches it, capture stops and the limit callback fires.
         """
         self.sample_rate = sample_rate
         self.channels = channels
+        self.max_seconds = max_seconds
         self.is_recording = False
         self.is_paused = False
-        self._audio_data = []
+        # Capture buffer and the number of valid frames in it
+        self._buffer: Optional[np.ndarray] = None
+        self._frames = 0
+        self._max_frames: Optional[int] = None
+        # Set once the current take reaches max_seconds; later frames are dropped
+        self.limit_reached = False
         self._stream = None
         self._lock = threading.Lock()
+        # Temp file behind the buffer once a long take spills to disk, and
+        # whether that failed for the current take (it stays in RAM then)
+        self._backing = None
+        self._spill_failed = False
+        # Blocks captured while the buffer was full, waiting for it to grow
+        self._pending = []
+        self._pending_frames = 0
+        # Grows the buffer for the audio callback, which must not allocate
+        self._grow_request = threading.Event()
+        self._grower: Optional[threading.Thread] = None
         self._level_callback: Optional[Callable[[float], None]] = None
+        self._limit_callback: Optional[Callable[[], None]] = None
+        self._warning_callback: Optional[Callable[[str], None]] = None
+
+        # Monotonic timing of the current take (excludes paused time)
+        self._record_started = 0.0
+        self._paused_accum = 0.0
+        self._pause_started: Optional[float] = None
 
     def set_level_callback(self, callback: Callable[[float], None]):
         """Set callback for audio level monitoring.
@@ -34,6 +78,27 @@ class AudioRecorder:
         """
         self._level_callback = callback
 
+    def set_limit_callback(self, callback: Callable[[], None]):
+        """Set callback for when a take reaches max_seconds.
+
+        Called once per take from the audio thread; the take keeps everything
+        captured up to the limit, and the callback should stop the recording.
+
+        Args:
+            callback: Function called with no arguments.
+        """
+        self._limit_callback = callback
+
+    def set_warning_callback(self, callback: Callable[[str], None]):
+        """Set callback for non-fatal recording problems.
+
+        Called from the recorder's buffer thread with a message for the user.
+
+        Args:
+            callback: Function that receives the warning message.
+        """
+        self._warning_callback = callback
+
     def start_recording(self, device_index: Optional[int] = None):
         """Start recording audio.
 
@@ -44,23 +109,53 @@ class AudioRecorder:
             return
 
         with self._lock:
-            self._audio_data = []
+            initial_frames = self.sample_rate * self.INITIAL_BUFFER_SECONDS
+            if self.max_seconds is None:
+                self._max_frames = None
+            else:
+                self._max_frames = max(1, int(self.sample_rate * self.max_seconds))
+                initial_frames = min(initial_frames, self._max_frames)
+            self._close_backing()
+            self._buffer = np.empty((initial_frames, self.channels), dtype=np.float32)
+            self._frames = 0
+            self._pending = []
+            self._pending_frames = 0
+            self._spill_failed = False
+            self.limit_reached = False
             self.is_recording = True
             self.is_paused = False
 
+        self._grow_request.clear()
+        self._grower = threading.Thread(target=self._grow_loop, name="capture-grow", daemon=True)
+        self._grower.start()
+
+        self._record_started = time.monotonic()
+        self._paused_accum = 0.0
+        self._pause_started = None
+
+        # Report levels once per interval of frames rather than per block
+        level_interval = max(1, self.sample_rate // self.LEVEL_UPDATE_HZ)
+        frames_since_level = 0
+
         def audio_callback(indata, frames, time, status):
             """Callback for audio stream."""
+            nonlocal frames_since_level
             if status:
                 print(f"Audio status: {status}")
 
             if self.is_recording and not self.is_paused:
                 with self._lock:
-                    self._audio_data.append(indata.copy())
+                    hit_limit = self._append_frames(indata)
+                if hit_limit and self._limit_callback:
+                    self._limit_callback()
 
                 # Calculate audio level for monitoring
                 if self._level_callback:
-                    level = np.abs(indata).mean()
-                    self._level_callback(float(level))
+                    frames_since_level += frames
+                    if frames_since_level >= level_interval:
+                        frames_since_level = 0
+                        level = np.abs(indata).mean()
+                        self._level_callback(float(level))
 
         self._stream = sd.InputStream(
             samplerate=self.sample_rate,
@@ -75,11 +170,15 @@ class AudioRecorder:
         """Pause the current recording."""
         if self.is_recording and not self.is_paused:
             self.is_paused = True
+            self._pause_started = time.monotonic()
 
     def resume_recording(self):
         """Resume a paused recording."""
         if self.is_recording and self.is_paused:
             self.is_paused = False
+            if self._pause_started is not None:
+                self._paused_accum += time.monotonic() - self._pause_started
+                self._pause_started = None
 
     def stop_recording(self) -> Optional[np.ndarray]:
         """Stop recording and return the audio data.
@@ -98,15 +197,187 @@ class AudioRecorder:
             self._stream.close()
             self._stream = None
 
+        if self._grower is not None:
+            self._grow_request.set()
+            self._grower.join()
+            self._grower = None
+
+        # The stream is closed, so blocks still waiting for room can be placed here
+        if self._pending_frames:
+            self._grow_buffer(self._frames + self._pending_frames)
+
         with self._lock:
-            if not self._audio_data:
+            if not self._frames:
+                self._buffer = None
+                self._close_backing()
                 return None
 
-            # Concatenate all audio chunks
-            audio = np.concatenate(self._audio_data, axis=0)
-            self._audio_data = []
+            # Hand back the filled part of the buffer (a view, no copy)
+            audio = self._buffer[:self._frames]
+            self._buffer = None
+            self._close_backing()
+            self._frames = 0
             return audio
 
+    def _append_frames(self, frames: np.ndarray) -> bool:
+        """Copy captured frames into the buffer.
+
+        Must be called with the lock held. Runs on the audio thread, so it
+        never allocates the buffer itself: past GROW_AT_FILL it asks the grow
+        thread for a bigger one, and a block that finds the buffer full waits
+        in _pending until that arrives. Frames past max_seconds are dropped.
+
+        Args:
+            frames: Block of captured frames, shaped (frames, channels).
+
+        Returns:
+            True if this block made the take reach its limit.
+        """
+        if self._buffer is None or self.limit_reached:
+            # Cleared while a late callback was still in flight, or already full
+            return False
+
+        start = self._frames + self._pending_frames
+        end = start + len(frames)
+        hit_limit = self._max_frames is not None and end >= self._max_frames
+        if hit_limit:
+            end = self._max_frames
+            frames = frames[:end - start]
+            self.limit_reached = True
+
+        capacity = len(self._buffer)
+        if self._pending_frames or end > capacity:
+            # The grow thread fell behind; keep the block until it catches up
+            self._pending.append(frames.copy())
+            self._pending_frames += len(frames)
+            self._grow_request.set()
+            return hit_limit
+
+        self._buffer[start:end] = frames
+        self._frames = end
+        can_grow = self._max_frames is None or capacity < self._max_frames
+        if can_grow and end >= capacity * self.GROW_AT_FILL:
+            self._grow_request.set()
+        return hit_limit
+
+    def _grow_loop(self):
+        """Grow the capture buffer whenever the audio callback asks, until the take stops."""
+        while True:
+            self._grow_request.wait()
+            self._grow_request.clear()
+            if not self.is_recording:
+                return
+            self._grow_buffer()
+
+    def _grow_buffer(self, min_capacity: int = 0):
+        """Double the capture buffer (to at least min_capacity), off the audio thread.
+
+        The allocation and the bulk copy run without the lock, since the
+        callback only ever writes past the frames already captured; the lock
+        is taken again just to copy that tail and swap buffers.
+
+        Args:
+            min_capacity: Smallest acceptable new length in frames.
+        """
+        with self._lock:
+            buffer, backing = self._buffer, self._backing
+            if buffer is None:
+                return
+            copied = self._frames
+            capacity = len(buffer)
+            new_capacity = max(2 * capacity, min_capacity,
+                               self._frames + self._pending_frames)
+            if self._max_frames is not None:
+                new_capacity = min(new_capacity, self._max_frames)
+            if new_capacity <= capacity:
+                return
+
+        on_disk = (not self._spill_failed
+                   and new_capacity > self.sample_rate * self.MEMORY_BUFFER_SECONDS)
+        grown, new_backing, warning = self._allocate(new_capacity, on_disk, backing)
+        remapped = new_backing is not None and new_backing is backing
+        if not remapped:
+            grown[:copied] = buffer[:copied]
+
+        with self._lock:
+            if self._buffer is not buffer:
+                # Cleared or restarted meanwhile; drop the new buffer
+                if new_backing is not None and new_backing is not backing:
+                    new_backing.close()
+                return
+            if not remapped:
+                # Frames captured while the bulk copy ran
+                grown[copied:self._frames] = buffer[copied:self._frames]
+                if backing is not None:
+                    self._close_backing()
+            self._buffer = grown
+            self._backing = new_backing
+            self._place_pending()
+
+        if warning:
+            self._spill_failed = True
+            if self._warning_callback:
+                self._warning_callback(warning)
+
+    def _allocate(self, capacity: int, on_disk: bool, backing):
+        """Allocate a capture buffer of the given length.
+
+        Args:
+            capacity: Buffer length in frames.
+            on_disk: Back the buffer with an anonymous temp file instead of RAM.
+            backing: Temp file behind the current buffer, if any.
+
+        Returns:
+            Tuple of (float32 array shaped (capacity, channels), temp file
+            behind it or None, warning message or None). When backing is
+            returned, the array maps the same file and already holds the frames.
+        """
+        shape = (capacity, self.channels)
+        if not on_disk:
+            return np.empty(shape, dtype=np.float32), None, None
+        try:
+            if backing is not None:
+                # Already on disk: extend the file and remap it; the frames
+                # are in the file already, so nothing is copied
+                backing.truncate(capacity * self.channels * 4)
+                return np.memmap(backing, dtype=np.float32, mode='r+', shape=shape), backing, None
+
+            # The file is unlinked already; the mapping keeps it alive until released
+            new_backing = tempfile.TemporaryFile(prefix="vtdc_take_")
+            try:
+                grown = np.memmap(new_backing, dtype=np.float32, mode='w+', shape=shape)
+            except (OSError, ValueError):
+                new_backing.close()
+                raise
+            return grown, new_backing, None
+        except (OSError, ValueError) as e:
+            warning = f"Long take is being kept in memory (temp file failed: {e})"
+            return np.empty(shape, dtype=np.float32), None, warning
+
+    def _place_pending(self):
+        """Move blocks waiting for room into the buffer, as far as they fit.
+
+        Must be called with the lock held.
+        """
+        capacity = len(self._buffer)
+        while self._pending and self._frames + len(self._pending[0]) <= capacity:
+            block = self._pending.pop(0)
+            end = self._frames + len(block)
+            self._buffer[self._frames:end] = block
+            self._frames = end
+            self._pending_frames -= len(block)
+        if self._pending:
+            self._grow_request.set()
+
+    def _close_backing(self):
+        """Close the temp file handle; live mappings keep the data until released."""
+        if self._backing is not None:
+            try:
+                self._backing.close()
+            except OSError:
+                pass
+            self._backing = None
+
     def save_audio(self, audio_data: np.ndarray, file_path: Path) -> bool:
         """Save audio data to a WAV file.
 
@@ -141,15 +412,31 @@ class AudioRecorder:
         """
         if audio_data is None:
             with self._lock:
-                if not self._audio_data:
-                    return 0.0
-                audio_data = np.concatenate(self._audio_data, axis=0)
+                return (self._frames + self._pending_frames) / self.sample_rate
 
-        if audio_data is None or len(audio_data) == 0:
+        if len(audio_data) == 0:
             return 0.0
 
         return len(audio_data) / self.sample_rate
 
+    def get_elapsed(self) -> float:
+        """Get the wall-clock length of the current take, excluding pauses.
+
+        Cheap enough to poll from a UI timer, unlike get_duration(), which
+        measures the captured audio itself.
+
+        Returns:
+            Elapsed recording time in seconds (0.0 when not recording).
+        """
+        if not self.is_recording:
+            return 0.0
+
+        now = time.monotonic()
+        elapsed = now - self._record_started - self._paused_accum
+        if self._pause_started is not None:
+            elapsed -= now - self._pause_started
+        return max(elapsed, 0.0)
+
     def has_audio_data(self) -> bool:
         """Check if there is recorded audio data.
 
@@ -157,9 +444,14 @@ class AudioRecorder:
             True if audio data exists, False otherwise.
         """
         with self._lock:
-            return len(self._audio_data) > 0
+            return self._frames + self._pending_frames > 0
 
     def clear_audio(self):
         """Clear all recorded audio data."""
         with self._lock:
-            self._audio_data = []
+            self._buffer = None
+            self._close_backing()
+            self._frames = 0
+            self._pending = []
+            self._pending_frames = 0
+            self.limit_reached = False
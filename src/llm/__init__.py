@@ -1,5 +1,5 @@
 """LLM text generation module."""
-from .generator import TextGenerator
+from .generator import TextGenerator, close_shared_http_client
 from .prompt_builder import PromptBuilder
 
-__all__ = ['TextGenerator', 'PromptBuilder']
+__all__ = ['TextGenerator', 'PromptBuilder', 'close_shared_http_client']
@@ -1,8 +1,44 @@
 """LLM text generation."""
+import threading
 from openai import OpenAI, OpenAIError
 from typing import Optional, Tuple
 from .prompt_builder import PromptBuilder
 
+# One HTTP client (and keep-alive pool) shared by every TextGenerator, so a
+# connection test followed by a generation reuses the same TLS connection
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def _shared_http_client():
+    """Get the HTTP client shared by all generators, creating it on first use.
+
+    Returns:
+        httpx client with the OpenAI SDK's default settings.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            # DefaultHttpxClient (openai >= 1.17) keeps the SDK's timeouts/limits
+            try:
+                from openai import DefaultHttpxClient as client_cls
+            except ImportError:
+                from httpx import Client as client_cls
+            _http_client = client_cls()
+        return _http_client
+
+
+def close_shared_http_client():
+    """Close the shared HTTP client and its connections, e.g. on app shutdown.
+
+    Generators created afterwards get a new client.
+    """
+    global _http_client
+    with _http_client_lock:
+        client, _http_client = _http_client, None
+    if client is not None:
+        client.close()
+
 
 class TextGenerator:
     """Generates synthetic text using OpenAI API."""
@@ -14,7 +50,7 @@ class TextGenerator:
             api_key: OpenAI API key.
             model: Model to use for generation.
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=_shared_http_client())
         self.model = model
         self.prompt_builder = PromptBuilder()
 
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 """Main entry point for Voice Training Data Creator (Flet version)."""
 import flet as ft
+import os
 from pathlib import Path
 import threading
 import time
 import tempfile
 import subprocess
 import platform
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 
 # Flet compatibility: support both old (Colors/Icons) and new (colors/icons)
 COLORS = getattr(ft, "colors", None) or getattr(ft, "Colors", None)
@@ -14,12 +18,77 @@ ICONS = getattr(ft, "icons", None) or getattr(ft, "Icons", None)
 
 from audio import AudioRecorder, DeviceManager
 from storage import ConfigManager, SampleManager
-from llm import TextGenerator
+from utils import Validators
+# llm (and the OpenAI client it pulls in) is imported lazily on first API use
+_text_generator_cls = None
+
+
+def _text_generator_class():
+    """Get the TextGenerator class, importing llm on first use.
+
+    Returns:
+        The TextGenerator class.
+    """
+    global _text_generator_cls
+    if _text_generator_cls is None:
+        from llm import TextGenerator
+        _text_generator_cls = TextGenerator
+    return _text_generator_cls
+
+
+def _close_llm_client():
+    """Close the OpenAI HTTP client, if llm was ever loaded."""
+    if _text_generator_cls is not None:
+        from llm import close_shared_http_client
+        close_shared_http_client()
+
+
+@lru_cache(maxsize=8)
+def _parse_dictionary(raw: str) -> tuple:
+    """Parse comma-separated dictionary words, dropping blanks.
+
+    Args:
+        raw: Raw dictionary input text.
+
+    Returns:
+        Tuple of stripped, non-empty words.
+    """
+    return tuple(w for w in (x.strip() for x in raw.split(',')) if w)
+
+
+@lru_cache(maxsize=4096)
+def _duration_texts(total_seconds: int) -> tuple:
+    """Format a whole-second duration for the recording labels.
+
+    Args:
+        total_seconds: Duration in whole seconds.
+
+    Returns:
+        Tuple of ("MM:SS", "Duration: MM:SS").
+    """
+    minutes, seconds = divmod(total_seconds, 60)
+    text = f"{minutes:02d}:{seconds:02d}"
+    return text, f"Duration: {text}"
 
 
 class VoiceTrainingApp:
     """Main application class for Flet."""
 
+    # Constant dropdown choices (Flet controls can't be shared between parents,
+    # so only the values are frozen here)
+    MODEL_OPTIONS = ("gpt-4o-mini", "gpt-4o", "gpt-4.1-mini")
+    STYLE_OPTIONS = ("General Purpose", "Colloquial", "Voice Note", "Technical", "Prose")
+
+    # Number of sample cards rendered per page update on first load
+    FILES_RENDER_CHUNK = 50
+
+    # Longest the recording timer sleeps between checks (bounds pause/resume lag)
+    RECORD_TIMER_MAX_WAIT = 0.5
+
+    # Texts longer than this get their character/word counts debounced
+    COUNT_DEBOUNCE_CHARS = 2000
+    COUNT_DEBOUNCE_SECONDS = 0.15
+
     def __init__(self, page: ft.Page):
         """Initialize the application.
 
@@ -58,19 +127,25 @@ class VoiceTrainingApp:
             'border': COLORS.GREY_300,
         }
 
+        # Goal progress colors, bound once for the stats refresh path
+        self._goal_color_done = COLORS.GREEN_700
+        self._goal_color_half = COLORS.BLUE_700
+        self._goal_color_low = COLORS.ORANGE_700
+
         # Initialize core components
         self.config = ConfigManager()
-        self.audio_recorder = AudioRecorder(sample_rate=self.config.get_sample_rate())
-        self.device_manager = DeviceManager()
+        self.audio_recorder = AudioRecorder(
+            sample_rate=self.config.get_sample_rate(),
+            max_seconds=self.config.get_max_recording_minutes() * 60,
+        )
+        self.audio_recorder.set_limit_callback(self._on_recording_limit)
+        self.audio_recorder.set_warning_callback(self._on_recording_warning)
+        # Enumerate devices in the background while the rest of startup runs
+        self.device_manager = DeviceManager(background=True)
 
-        # Initialize text generator
-        api_key = self.config.get_api_key() or ""
-        model = self.config.get_openai_model()
-        try:
-            self.text_generator = TextGenerator(api_key, model)
-        except Exception as e:
-            print(f"Warning: Failed to initialize text generator: {e}")
-            self.text_generator = TextGenerator("", model)
+        # Text generator is created lazily on first API use
+        self.text_generator = None
+        self._text_generator_key = None
 
         # Initialize sample manager
         base_path = self.config.get_base_path()
@@ -82,13 +157,59 @@ class VoiceTrainingApp:
         # Session state
         self.current_audio = None
         self.session_samples = 0
+        self._sample_dirty = False
+        # Last text value checked by _has_text() and whether it had content
+        self._text_value_seen = None
+        self._text_nonempty = False
+        # Pending debounced count update for long texts, and the characters per
+        # word from the last exact count (used for the estimate while typing)
+        self._count_timer = None
+        self._chars_per_word = 6.0
+        self._update_depth = 0
         self._record_timer_thread = None
         self._record_timer_stop = threading.Event()
+        # Wakes a paused timer thread on resume or stop
+        self._record_timer_wake = threading.Event()
+
+        # Background pool for blocking I/O (external launches, dataset scans)
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        # Compile the audio check kernels now rather than when the first take stops
+        self._io_pool.submit(Validators.warm_up)
+        self._scan_future = None
+        # Refresh callbacks waiting on the background scan, run once when it ends
+        self._scan_refreshes = []
+        self._scan_lock = threading.Lock()
+        # Disk space check started when a take finishes, read back on save
+        self._disk_check_future = None
+
+        # Base path fields, set once the Settings tab / legacy dialog are built
+        self.settings_base_path_field = None
+        self.base_path_field = None
+        # Narration viewer font size, kept across openings and sessions
+        self.narration_font_size = self.config.get_narration_font_size()
+        # Dataset stats changed while their tab was hidden
+        self._dataset_stats_stale = False
+        # Training files list needs (re)loading next time its tab is shown
+        self._training_files_stale = True
+        # Settings API key field is filled from the keyring on first view
+        self._settings_api_key_loaded = False
 
         # Audio playback state
         self.audio_player = None
         self.current_playing_sample = None
 
+        # Settings dialog (built lazily on first open)
+        self._settings_dialog = None
+        # Narration viewer (built lazily on first open)
+        self._narration_dialog = None
+
+        # Reusable dialogs
+        self._info_dialog = self._build_message_dialog()
+        self._error_dialog = self._build_message_dialog()
+        self._about_dialog = None
+        self._confirm_delete_dialog = None
+        self._pending_delete_num = None
+
         # Build UI
         self.build_ui()
 
@@ -361,13 +482,7 @@ class VoiceTrainingApp:
         self.style_dropdown = ft.Dropdown(
             label="Style",
             width=300,
-            options=[
-                ft.dropdown.Option("General Purpose"),
-                ft.dropdown.Option("Colloquial"),
-                ft.dropdown.Option("Voice Note"),
-                ft.dropdown.Option("Technical"),
-                ft.dropdown.Option("Prose"),
-            ],
+            options=[ft.dropdown.Option(style) for style in self.STYLE_OPTIONS],
             value="General Purpose",
         )
 
@@ -384,7 +499,13 @@ class VoiceTrainingApp:
             expand=True,
         )
 
-        # Generate buttons with consistent styling
+        # Generate buttons with consistent styling (one style shared by all three)
+        text_btn_style = ft.ButtonStyle(
+            shape=ft.RoundedRectangleBorder(radius=8),
+            elevation={"": 2, "hovered": 4, "disabled": 0},
+            padding=ft.padding.symmetric(horizontal=20, vertical=12),
+        )
+
         self.generate_btn = ft.ElevatedButton(
             "Generate Text",
             icon=ICONS.AUTO_AWESOME,
@@ -392,11 +513,7 @@ class VoiceTrainingApp:
             bgcolor=self.colors['primary'],
             color=COLORS.WHITE,
             tooltip="Generate new text using AI based on your parameters",
-            style=ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=8),
-                elevation={"": 2, "hovered": 4},
-                padding=ft.padding.symmetric(horizontal=20, vertical=12),
-            ),
+            style=text_btn_style,
         )
 
         self.new_sample_btn = ft.ElevatedButton(
@@ -407,11 +524,7 @@ class VoiceTrainingApp:
             bgcolor=self.colors['success'],
             color=COLORS.WHITE,
             tooltip="Clear everything and start a completely new sample",
-            style=ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=8),
-                elevation={"": 2, "hovered": 4, "disabled": 0},
-                padding=ft.padding.symmetric(horizontal=20, vertical=12),
-            ),
+            style=text_btn_style,
         )
 
         self.regenerate_btn = ft.ElevatedButton(
@@ -422,11 +535,7 @@ class VoiceTrainingApp:
             bgcolor=self.colors['accent'],
             color=COLORS.WHITE,
             tooltip="Generate different text with the same parameters",
-            style=ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=8),
-                elevation={"": 2, "hovered": 4, "disabled": 0},
-                padding=ft.padding.symmetric(horizontal=20, vertical=12),
-            ),
+            style=text_btn_style,
         )
 
         # Text display - expandable
@@ -473,10 +582,9 @@ class VoiceTrainingApp:
             The recording panel widget.
         """
         # Device selector
-        devices = self.device_manager.get_input_devices()
+        self._load_input_devices()
         device_options = [
-            ft.dropdown.Option(text=f"{d['name']} (Device {d['index']})", key=str(d['index']))
-            for d in devices
+            ft.dropdown.Option(text=text, key=key) for key, text in self._device_option_labels
         ]
 
         # Set default to preferred device if available
@@ -484,7 +592,7 @@ class VoiceTrainingApp:
         default_device = None
         if preferred_device and preferred_device["device_index"] is not None:
             # Check if preferred device is still available
-            if any(d['index'] == preferred_device["device_index"] for d in devices):
+            if preferred_device["device_index"] in self._device_name_by_index:
                 default_device = str(preferred_device["device_index"])
 
         if default_device is None and device_options:
@@ -497,6 +605,12 @@ class VoiceTrainingApp:
             expand=True,
         )
 
+        self.rescan_devices_btn = ft.IconButton(
+            icon=ICONS.REFRESH,
+            on_click=self.rescan_input_devices,
+            tooltip="Rescan microphones",
+        )
+
         self.test_mic_btn = ft.ElevatedButton(
             "Test Mic",
             icon=ICONS.MIC_NONE,
@@ -521,7 +635,14 @@ class VoiceTrainingApp:
             text_align=ft.TextAlign.CENTER,
         )
 
-        # Recording buttons with professional styling
+        # Recording buttons with professional styling (one style shared by all four)
+        control_btn_style = ft.ButtonStyle(
+            shape=ft.RoundedRectangleBorder(radius=8),
+            elevation={"": 2, "hovered": 4},
+            padding=ft.padding.symmetric(horizontal=20, vertical=16),
+            text_style=ft.TextStyle(size=16, weight=ft.FontWeight.W_600),
+        )
+
         self.record_btn = ft.ElevatedButton(
             "Record",
             icon=ICONS.FIBER_MANUAL_RECORD,
@@ -531,12 +652,7 @@ class VoiceTrainingApp:
             expand=True,
             visible=True,
             tooltip="Start recording your voice",
-            style=ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=8),
-                elevation={"": 2, "hovered": 4},
-                padding=ft.padding.symmetric(horizontal=20, vertical=16),
-                text_style=ft.TextStyle(size=16, weight=ft.FontWeight.W_600),
-            ),
+            style=control_btn_style,
         )
 
         self.pause_btn = ft.ElevatedButton(
@@ -548,12 +664,7 @@ class VoiceTrainingApp:
             expand=True,
             visible=False,
             tooltip="Pause/resume recording",
-            style=ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=8),
-                elevation={"": 2, "hovered": 4},
-                padding=ft.padding.symmetric(horizontal=20, vertical=16),
-                text_style=ft.TextStyle(size=16, weight=ft.FontWeight.W_600),
-            ),
+            style=control_btn_style,
         )
 
         self.stop_btn = ft.ElevatedButton(
@@ -565,12 +676,7 @@ class VoiceTrainingApp:
             expand=True,
             visible=False,
             tooltip="Stop recording and save the audio",
-            style=ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=8),
-                elevation={"": 2, "hovered": 4},
-                padding=ft.padding.symmetric(horizontal=20, vertical=16),
-                text_style=ft.TextStyle(size=16, weight=ft.FontWeight.W_600),
-            ),
+            style=control_btn_style,
         )
 
         self.retake_btn = ft.ElevatedButton(
@@ -582,12 +688,7 @@ class VoiceTrainingApp:
             expand=True,
             visible=False,
             tooltip="Discard current recording and start over immediately",
-            style=ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=8),
-                elevation={"": 2, "hovered": 4},
-                padding=ft.padding.symmetric(horizontal=20, vertical=16),
-                text_style=ft.TextStyle(size=16, weight=ft.FontWeight.W_600),
-            ),
+            style=control_btn_style,
         )
 
         self.delete_btn = ft.OutlinedButton(
@@ -611,7 +712,7 @@ class VoiceTrainingApp:
                     [
                         ft.Text("Recording Controls", size=20, weight=ft.FontWeight.BOLD, color=self.colors['text_primary']),
                         ft.Container(height=4),
-                        ft.Row([self.device_dropdown, self.test_mic_btn], spacing=12),
+                        ft.Row([self.device_dropdown, self.rescan_devices_btn, self.test_mic_btn], spacing=12),
                         ft.Container(height=8),
                         ft.Container(
                             content=ft.Column([
@@ -640,12 +741,12 @@ class VoiceTrainingApp:
         Returns:
             The statistics panel widget.
         """
-        total_samples = self.sample_manager.get_total_samples()
-        total_duration = self.sample_manager.estimate_total_duration(self.audio_recorder.sample_rate)
-
         self.session_label = ft.Text(f"This Session: {self.session_samples} samples")
-        self.total_label = ft.Text(f"Total: {total_samples} samples", weight=ft.FontWeight.BOLD)
-        self.duration_stats_label = ft.Text(f"Total Duration: {total_duration:.1f} min")
+        self.total_label = ft.Text("Total: 0 samples", weight=ft.FontWeight.BOLD)
+        self.duration_stats_label = ft.Text("Total Duration: 0.0 min")
+
+        # Populate totals (scanned in the background on a cold cache)
+        self.refresh_statistics()
 
         return ft.Card(
             content=ft.Container(
@@ -695,6 +796,8 @@ class VoiceTrainingApp:
             size=14,
             weight=ft.FontWeight.BOLD,
         )
+        self._last_progress_color = None
+        self._last_stats_key = None
 
         refresh_btn = ft.ElevatedButton(
             "Refresh Stats",
@@ -743,6 +846,13 @@ class VoiceTrainingApp:
 
         # File list container (populated on refresh)
         self.files_list = ft.Column([], spacing=10, scroll=ft.ScrollMode.AUTO, expand=True)
+        self.files_empty_text = ft.Text(
+            "No training files found. Start recording to create samples!",
+            size=14, italic=True, color=COLORS.GREY_600,
+        )
+
+        # Sample cards keyed by (number, duration, text) for incremental refresh
+        self._sample_cards = {}
 
         # Refresh button
         refresh_files_btn = ft.ElevatedButton(
@@ -751,7 +861,7 @@ class VoiceTrainingApp:
             on_click=lambda _: self.refresh_training_files(),
         )
 
-        # Stats label
+        # Stats label (files load when the tab is first shown)
         self.files_stats_label = ft.Text("Loading files...", size=14)
 
         # Main content
@@ -767,9 +877,6 @@ class VoiceTrainingApp:
             expand=True,
         )
 
-        # Initial load
-        self.refresh_training_files()
-
         return ft.Container(content=content, padding=20, expand=True)
 
     def build_settings_tab(self):
@@ -780,7 +887,6 @@ class VoiceTrainingApp:
         """
         # Current values
         current_base = str(self.config.get_base_path() or "")
-        current_api = self.config.get_api_key() or ""
         current_model = self.config.get_openai_model()
         current_rate = str(self.config.get_sample_rate())
         current_auto = self.config.get_autogenerate_next()
@@ -805,9 +911,10 @@ class VoiceTrainingApp:
         )
 
         # API section
+        # Value is read from the keyring when the tab is first shown
         self.settings_api_key_field = ft.TextField(
             label="OpenAI API Key",
-            value=current_api,
+            value="",
             password=True,
             can_reveal_password=True,
             expand=True,
@@ -817,11 +924,7 @@ class VoiceTrainingApp:
         self.settings_model_dropdown = ft.Dropdown(
             label="OpenAI Model",
             value=current_model,
-            options=[
-                ft.dropdown.Option("gpt-4o-mini"),
-                ft.dropdown.Option("gpt-4o"),
-                ft.dropdown.Option("gpt-4.1-mini"),
-            ],
+            options=self._model_options(),
             width=300,
         )
 
@@ -840,7 +943,7 @@ class VoiceTrainingApp:
             self.settings_api_status.color = COLORS.GREY_600
             self.page.update()
 
-            tg = TextGenerator(api_key, model)
+            tg = self._text_generator_for(api_key, model)
             ok, err = tg.test_connection()
             if ok:
                 self.settings_api_status.value = "✓ API connection successful"
@@ -851,11 +954,9 @@ class VoiceTrainingApp:
             self.page.update()
 
         # Audio settings
-        devices = self.device_manager.get_input_devices()
         device_options = [ft.dropdown.Option(text="None (use system default)", key="none")]
         device_options.extend([
-            ft.dropdown.Option(text=f"{d['name']} (Device {d['index']})", key=str(d['index']))
-            for d in devices
+            ft.dropdown.Option(text=text, key=key) for key, text in self._device_option_labels
         ])
 
         self.settings_preferred_mic_dropdown = ft.Dropdown(
@@ -891,63 +992,60 @@ class VoiceTrainingApp:
         self.settings_save_status = ft.Text("", size=12, weight=ft.FontWeight.BOLD)
 
         def on_save_settings(_):
-            # Persist config
-            base = self.settings_base_path_field.value.strip()
-            if base:
-                self.config.set_base_path(Path(base))
-                self.sample_manager = SampleManager(Path(base))
-                self.refresh_statistics()
-                self.refresh_dataset_stats()
-
-            # API key and model
-            api_key = self.settings_api_key_field.value.strip()
-            if api_key:
-                self.config.set_api_key(api_key)
-            self.config.set_openai_model(self.settings_model_dropdown.value)
-
-            # Sample rate
-            try:
-                rate = int(self.settings_sample_rate_field.value)
-                if rate > 0:
-                    self.config.set_sample_rate(rate)
-                    self.audio_recorder.sample_rate = rate
-            except Exception:
-                pass
-
-            # Preferred microphone
-            if self.settings_preferred_mic_dropdown.value and self.settings_preferred_mic_dropdown.value != "none":
+            # Persist config in a single write
+            with self.config.batch():
+                base = (self.settings_base_path_field.value or "").strip()
+                if base:
+                    base_path = Path(base)
+                    self.config.set_base_path(base_path)
+                    self.sample_manager = SampleManager(base_path)
+                    self.refresh_statistics()
+                    self.refresh_dataset_stats()
+                    self.refresh_training_files()
+
+                # API key and model
+                api_key = (self.settings_api_key_field.value or "").strip()
+                if api_key:
+                    self.config.set_api_key(api_key)
+                self.config.set_openai_model(self.settings_model_dropdown.value)
+
+                # Sample rate
                 try:
-                    device_idx = int(self.settings_preferred_mic_dropdown.value)
-                    device_name = next((d['name'] for d in devices if d['index'] == device_idx), "Unknown")
-                    self.config.set_preferred_device(device_idx, device_name)
-                    # Update the main dropdown to match
-                    self.device_dropdown.value = str(device_idx)
+                    rate = int(self.settings_sample_rate_field.value)
+                    if rate > 0:
+                        self.config.set_sample_rate(rate)
+                        self.audio_recorder.sample_rate = rate
                 except Exception:
                     pass
-            else:
-                self.config.set("preferred_device_index", None)
-                self.config.set("preferred_device_name", None)
-
-            # Autogenerate setting
-            self.config.set_autogenerate_next(self.settings_auto_checkbox.value)
-            self.autogenerate_checkbox.value = self.settings_auto_checkbox.value
 
-            # Goal duration
-            try:
-                goal = float(self.settings_goal_duration_field.value)
-                if goal > 0:
-                    self.config.set_goal_duration(goal)
-            except Exception:
-                pass
+                # Preferred microphone
+                if self.settings_preferred_mic_dropdown.value and self.settings_preferred_mic_dropdown.value != "none":
+                    try:
+                        device_idx = int(self.settings_preferred_mic_dropdown.value)
+                        device_name = self._device_name_by_index.get(device_idx, "Unknown")
+                        self.config.set_preferred_device(device_idx, device_name)
+                        # Update the main dropdown to match
+                        self.device_dropdown.value = str(device_idx)
+                    except Exception:
+                        pass
+                else:
+                    self.config.set("preferred_device_index", None)
+                    self.config.set("preferred_device_name", None)
+
+                # Autogenerate setting
+                self.config.set_autogenerate_next(self.settings_auto_checkbox.value)
+                self.autogenerate_checkbox.value = self.settings_auto_checkbox.value
+
+                # Goal duration
+                try:
+                    goal = float(self.settings_goal_duration_field.value)
+                    if goal > 0:
+                        self.config.set_goal_duration(goal)
+                except Exception:
+                    pass
 
-            # Update status bar and text generator
+            # Update status bar (text generator is rebuilt lazily if key/model changed)
             self.status_bar.value = self.get_status_text()
-            try:
-                api_key = self.config.get_api_key() or ""
-                model = self.config.get_openai_model()
-                self.text_generator = TextGenerator(api_key, model)
-            except Exception:
-                pass
 
             # Show success message
             self.settings_save_status.value = "✓ Settings saved successfully"
@@ -1012,6 +1110,31 @@ class VoiceTrainingApp:
 
         return ft.Container(content=content, padding=20)
 
+    def _load_input_devices(self):
+        """Enumerate input devices and index them by device index.
+
+        An enumeration failure is reported and leaves the lists empty.
+
+        Returns:
+            List of input device info dictionaries.
+        """
+        try:
+            self._input_devices = self.device_manager.get_input_devices()
+        except Exception as e:
+            self._input_devices = []
+            self.show_error_dialog("Audio Devices Unavailable", f"Could not list input devices: {e}")
+        self._device_name_by_index = {d['index']: d['name'] for d in self._input_devices}
+        # (key, label) pairs shared by both microphone dropdowns
+        self._device_option_labels = tuple(
+            (str(d['index']), f"{d['name']} (Device {d['index']})") for d in self._input_devices
+        )
+        return self._input_devices
+
+    @classmethod
+    def _model_options(cls):
+        """Build fresh dropdown options for the supported OpenAI models."""
+        return [ft.dropdown.Option(model) for model in cls.MODEL_OPTIONS]
+
     # Event handlers
     def on_autogenerate_toggled(self, e):
         """Handle autogenerate checkbox toggle."""
@@ -1020,25 +1143,78 @@ class VoiceTrainingApp:
     def toggle_dictionary(self, e):
         """Toggle dictionary input."""
         self.dict_input.disabled = not e.control.value
-        self.page.update()
+        self.dict_input.update()
 
     def on_text_changed(self, e):
         """Update character and word counts."""
-        text = self.text_edit.value or ""
-        char_count = len(text)
-        word_count = len(text.split()) if text.strip() else 0
-        self.char_count_label.value = f"Characters: {char_count} | Words: {word_count}"
+        self._sample_dirty = True
+        has_text = self._has_text()
+
+        # Recounting a long text on every keystroke is wasted work; count once
+        # typing pauses
+        if self._count_timer is not None:
+            self._count_timer.cancel()
+            self._count_timer = None
+        length = len(self.text_edit.value or "")
+        if length > self.COUNT_DEBOUNCE_CHARS:
+            self._count_timer = threading.Timer(self.COUNT_DEBOUNCE_SECONDS, self._update_text_counts)
+            self._count_timer.daemon = True
+            self._count_timer.start()
+            # Until then show the exact character count (O(1)) and an estimated word count
+            self.char_count_label.value = (
+                f"Characters: {length} | Words: ~{round(length / self._chars_per_word)}"
+            )
+            self.char_count_label.update()
+        else:
+            self._update_text_counts()
+
+        # Scoped updates: avoid diffing the whole page on every keystroke,
+        # and only touch buttons whose enabled state flipped
+        save_disabled = self.save_btn.disabled
         self.check_save_enabled()
-        has_text = bool(text.strip())
-        self.new_sample_btn.disabled = not has_text
-        self.page.update()
+        if self.save_btn.disabled != save_disabled:
+            self.save_btn.update()
+        if self.new_sample_btn.disabled != (not has_text):
+            self.new_sample_btn.disabled = not has_text
+            self.new_sample_btn.update()
+
+    def _update_text_counts(self):
+        """Update the character and word count label from the current text."""
+        self._set_text_counts()
+        try:
+            self.char_count_label.update()
+        except Exception:
+            pass
+
+    def _set_text_counts(self):
+        """Recompute the character and word count label value without sending it."""
+        text = self.text_edit.value or ""
+        word_count = len(text.split()) if self._has_text() else 0
+        if word_count:
+            self._chars_per_word = len(text) / word_count
+        self.char_count_label.value = f"Characters: {len(text)} | Words: {word_count}"
+
+    def _set_editor_text(self, text: str):
+        """Replace the editor text from code and recount once.
+
+        Programmatic changes don't fire on_change, so the counts are refreshed
+        here; the caller's page update sends them along with the text.
+
+        Args:
+            text: New editor text.
+        """
+        if self._count_timer is not None:
+            self._count_timer.cancel()
+            self._count_timer = None
+        self.text_edit.value = text
+        self._set_text_counts()
 
     def generate_text(self, e):
         """Generate text using LLM."""
         # Disable controls
         self.generate_btn.disabled = True
         self.generate_btn.text = "⏳ Generating..."
-        self.page.update()
+        self.generate_btn.update()
 
         try:
             duration = float(self.duration_field.value)
@@ -1047,9 +1223,9 @@ class VoiceTrainingApp:
 
             dictionary = None
             if self.use_dict_checkbox.value and self.dict_input.value:
-                dictionary = [w.strip() for w in self.dict_input.value.split(',') if w.strip()]
+                dictionary = _parse_dictionary(self.dict_input.value)
 
-            text, error = self.text_generator.generate_text(
+            text, error = self._get_text_generator().generate_text(
                 duration_minutes=duration,
                 wpm=wpm,
                 style=style,
@@ -1059,7 +1235,8 @@ class VoiceTrainingApp:
             if error:
                 self.show_error_dialog("Generation Error", f"Failed to generate text:\n{error}")
             elif text:
-                self.text_edit.value = text
+                self._set_editor_text(text)
+                self._sample_dirty = True
                 self.new_sample_btn.disabled = False
                 self.regenerate_btn.disabled = False
             else:
@@ -1070,37 +1247,138 @@ class VoiceTrainingApp:
         finally:
             self.generate_btn.disabled = False
             self.generate_btn.text = "Generate Text"
-            self.page.update()
+            # Only these controls change during generation; push them in one message
+            self.page.update(
+                self.generate_btn, self.text_edit, self.char_count_label,
+                self.new_sample_btn, self.regenerate_btn,
+            )
 
     def new_sample(self, e):
         """Start a completely new sample, clearing current state."""
-        # Clear text
-        self.text_edit.value = ""
-
-        # Clear audio if present
-        if self.current_audio is not None:
-            self.current_audio = None
-            self.audio_recorder.clear_audio()
-
-        # Reset UI state
-        self.duration_label.value = "Duration: 00:00"
-        self.status_label.value = "Ready to record"
-        self.delete_btn.disabled = True
-        self.new_sample_btn.disabled = True
-        self.regenerate_btn.disabled = True
-        self.save_btn.disabled = True
+        # Skip the reset entirely when nothing changed since the last one
+        if self._sample_dirty:
+            # Clear text
+            self._set_editor_text("")
+
+            # Clear audio if present
+            if self.current_audio is not None:
+                self.current_audio = None
+                self.audio_recorder.clear_audio()
+
+            # Reset UI state
+            self.duration_label.value = "Duration: 00:00"
+            self.status_label.value = "Ready to record"
+            self.delete_btn.disabled = True
+            self.new_sample_btn.disabled = True
+            self.regenerate_btn.disabled = True
+            self.save_btn.disabled = True
+            self._sample_dirty = False
 
-        self.page.update()
+            self.page.update()
 
         # Auto-generate if enabled
         if self.config.get_autogenerate_next():
             self.generate_text(None)
 
+    def _get_text_generator(self):
+        """Get the text generator, rebuilding it only if the API key or model changed.
+
+        Returns:
+            TextGenerator for the current configuration.
+        """
+        return self._text_generator_for(self.config.get_api_key() or "", self.config.get_openai_model())
+
+    def _text_generator_for(self, api_key: str, model: str):
+        """Get a text generator for the given credentials, reusing the cached one where possible.
+
+        Args:
+            api_key: OpenAI API key.
+            model: Model to use for generation.
+
+        Returns:
+            TextGenerator for the given API key and model.
+        """
+        key = (api_key, model)
+        if self.text_generator is not None and key != self._text_generator_key \
+                and api_key == self._text_generator_key[0]:
+            # Same key, new model: keep the client and its connection pool
+            self.text_generator.model = model
+            self._text_generator_key = key
+        if self.text_generator is None or key != self._text_generator_key:
+            TextGenerator = _text_generator_class()
+            try:
+                self.text_generator = TextGenerator(api_key, model)
+            except Exception as e:
+                print(f"Warning: Failed to initialize text generator: {e}")
+                self.text_generator = TextGenerator("", model)
+            self._text_generator_key = key
+        return self.text_generator
+
+    def _has_text(self) -> bool:
+        """Check whether the text editor holds any non-whitespace text.
+
+        Returns:
+            True if there is text to save (rechecked only when the value changes).
+        """
+        value = self.text_edit.value
+        if value is not self._text_value_seen:
+            self._text_value_seen = value
+            self._text_nonempty = bool(value) and not value.isspace()
+        return self._text_nonempty
+
+    def _start_disk_check(self):
+        """Check free space for the base path in the background."""
+        base_path = self.config.get_base_path()
+        if base_path:
+            self._disk_check_future = self._io_pool.submit(Validators.check_disk_space, base_path)
+
+    def _start_quality_check(self, audio):
+        """Scan a finished take for clipping and long silence in the background.
+
+        Args:
+            audio: Recorded audio data.
+        """
+        sample_rate = self.audio_recorder.sample_rate
+
+        def on_done(future):
+            # Ignore results for a take that was discarded or replaced meanwhile
+            if future.exception() is not None or self.current_audio is not audio:
+                return
+            clipping, long_silence = future.result()
+            problems = [name for name, found in (("clipping", clipping), ("long silence", long_silence)) if found]
+            if not problems:
+                return
+            self.status_label.value = f"⚠ Recording complete ({' and '.join(problems)} detected)"
+            self.status_label.color = self.colors['warning']
+            try:
+                self.status_label.update()
+            except Exception:
+                pass
+
+        self._io_pool.submit(Validators.quality_scan, audio, sample_rate).add_done_callback(on_done)
+
+    def _disk_check_result(self):
+        """Get the disk space check result, checking now if none is ready.
+
+        A background result reporting a problem is re-checked synchronously,
+        so a stale reading never stands on its own.
+
+        Returns:
+            Tuple of (has_space, error_message).
+        """
+        future, self._disk_check_future = self._disk_check_future, None
+        if future is not None and future.done():
+            has_space, space_error = future.result()
+            if has_space:
+                return has_space, space_error
+        base_path = self.config.get_base_path()
+        Validators.invalidate_disk_cache(base_path)
+        return Validators.check_disk_space(base_path)
+
     def check_save_enabled(self):
         """Check if save button should be enabled."""
         has_audio = self.current_audio is not None
-        has_text = bool(self.text_edit.value and self.text_edit.value.strip())
-        self.save_btn.disabled = not (has_audio and has_text)
+        self.save_btn.disabled = not (has_audio and self._has_text())
 
     def save_sample(self, e):
         """Save the current sample."""
@@ -1112,49 +1390,54 @@ class VoiceTrainingApp:
             self.show_error_dialog("No Recording", "Please record audio before saving.")
             return
 
-        if not self.text_edit.value or not self.text_edit.value.strip():
+        text = (self.text_edit.value or "").strip()
+        if not text:
             self.show_error_dialog("No Text", "Please generate or enter text before saving.")
             return
 
-        # Prepare temp audio file
-        try:
-            base = self.config.get_base_path()
-            tmp_dir = base / "_tmp"
-            tmp_dir.mkdir(parents=True, exist_ok=True)
-            tmp_wav = tmp_dir / "current.wav"
-
-            # Save current audio to temp path
-            saved = self.audio_recorder.save_audio(self.current_audio, tmp_wav)
-            if not saved:
-                self.show_error_dialog("Save Failed", "Could not save audio to disk.")
-                return
+        # Advisory only: low space is reported after saving, never blocks it
+        # (a write that really runs out of space fails with its own error)
+        has_space, space_error = self._disk_check_result()
 
+        try:
             # Build metadata
             generation_params = {
                 "duration_minutes": float(self.duration_field.value or 0),
                 "wpm": int(self.wpm_field.value or 0),
                 "style": self.style_dropdown.value,
                 "used_dictionary": bool(self.use_dict_checkbox.value),
-                "dictionary": [w.strip() for w in (self.dict_input.value or '').split(',') if w.strip()] if self.use_dict_checkbox.value else [],
+                "dictionary": _parse_dictionary(self.dict_input.value or '') if self.use_dict_checkbox.value else (),
                 "model": self.config.get_openai_model(),
                 "sample_rate": self.audio_recorder.sample_rate,
             }
             metadata = self.sample_manager.create_metadata(generation_params)
 
-            # Persist via SampleManager (moves file into place and writes text/metadata)
-            ok, err = self.sample_manager.save_sample(tmp_wav, self.text_edit.value.strip(), metadata)
+            # Persist via SampleManager (writes audio straight into the sample folder)
+            ok, err = self.sample_manager.save_sample_from_array(
+                self.current_audio, self.audio_recorder.sample_rate, text, metadata
+            )
             if not ok:
                 self.show_error_dialog("Save Failed", f"Error saving sample: {err}")
                 return
 
-            # Update UI state
+            # The save used disk space; the next check must read it fresh
+            Validators.invalidate_disk_cache(self.config.get_base_path())
+
+            # Update UI state; stats refresh on save/delete/settings events only
             self.session_samples += 1
-            self.refresh_statistics()
-            self.page.update()
+            with self._batch_updates():
+                self.refresh_statistics()
+                self.refresh_dataset_stats()
+                self.refresh_training_files()
 
             # Start a new sample automatically
             self.new_sample(None)
 
+            if not has_space:
+                self.status_label.value = f"⚠ Sample saved. {space_error}"
+                self.status_label.color = self.colors['warning']
+                self.status_label.update()
+
         except Exception as ex:
             self.show_error_dialog("Error", str(ex))
 
@@ -1180,6 +1463,8 @@ class VoiceTrainingApp:
             self.show_error_dialog("Recording Error", str(ex))
             return
 
+        self._sample_dirty = True
+
         # Update main panel buttons visibility and status with visual feedback
         self.record_btn.visible = False
         self.pause_btn.visible = True
@@ -1203,37 +1488,55 @@ class VoiceTrainingApp:
 
         # Start timer thread to update duration label live
         self._record_timer_stop.clear()
+        self._record_timer_wake.clear()
 
         def _timer_loop():
+            last_secs = -1
             while not self._record_timer_stop.is_set():
-                seconds = self.audio_recorder.get_duration()
-                mins = int(seconds // 60)
-                secs = int(seconds % 60)
-                duration_text = f"{mins:02d}:{secs:02d}"
-                self.duration_label.value = f"Duration: {duration_text}"
-                self.appbar_duration_label.value = duration_text
-                try:
-                    self.page.update()
-                except Exception:
-                    pass
-                time.sleep(0.3)
+                if self.audio_recorder.is_paused:
+                    # Nothing changes while paused; sleep until resumed or stopped
+                    self._record_timer_wake.wait()
+                    self._record_timer_wake.clear()
+                    continue
+                elapsed = self.audio_recorder.get_elapsed()
+                secs = int(elapsed)
+                # Label only changes once per second; skip redundant formatting/updates
+                if secs != last_secs:
+                    last_secs = secs
+                    duration_text, duration_label = _duration_texts(secs)
+                    self.duration_label.value = duration_label
+                    self.appbar_duration_label.value = duration_text
+                    try:
+                        self.page.update(self.duration_label, self.appbar_duration_label)
+                    except Exception:
+                        pass
+                # Wake when the displayed second rolls over (or on stop)
+                wait = min(max(secs + 1 - elapsed, 0.01), self.RECORD_TIMER_MAX_WAIT)
+                self._record_timer_stop.wait(wait)
 
         self._record_timer_thread = threading.Thread(target=_timer_loop, daemon=True)
         self._record_timer_thread.start()
 
     def open_narration_view(self):
         """Open a large, high-contrast text viewer for narration."""
-        if not (self.text_edit.value and self.text_edit.value.strip()):
+        if not self._has_text():
             self.show_error_dialog("No Text", "Generate or enter text first.")
             return
 
-        # Default font size for narration
-        if not hasattr(self, "narration_font_size"):
-            self.narration_font_size = 22
+        if self._narration_dialog is None:
+            self._build_narration_dialog()
+
+        # Refresh the text for this opening; the font size is kept across openings
+        self.narration_text.value = self.text_edit.value
+
+        self.page.dialog = self._narration_dialog
+        self._narration_dialog.open = True
+        self.page.update()
 
+    def _build_narration_dialog(self):
+        """Build the narration viewer once; its text is refreshed on each open."""
         # Text field for readable narration
         self.narration_text = ft.TextField(
-            value=self.text_edit.value,
             multiline=True,
             read_only=True,
             text_style=ft.TextStyle(size=self.narration_font_size),
@@ -1241,15 +1544,17 @@ class VoiceTrainingApp:
             expand=True,
         )
 
+        def set_font_size(size):
+            # Resize the field's own TextStyle in place and send only the field
+            self.narration_font_size = size
+            self.narration_text.text_style.size = size
+            self.narration_text.update()
+
         def inc_font(_):
-            self.narration_font_size = min(self.narration_font_size + 2, 64)
-            self.narration_text.text_style = ft.TextStyle(size=self.narration_font_size)
-            self.page.update()
+            set_font_size(min(self.narration_font_size + 2, 64))
 
         def dec_font(_):
-            self.narration_font_size = max(self.narration_font_size - 2, 12)
-            self.narration_text.text_style = ft.TextStyle(size=self.narration_font_size)
-            self.page.update()
+            set_font_size(max(self.narration_font_size - 2, 12))
 
         def copy_text(_):
             try:
@@ -1275,27 +1580,49 @@ class VoiceTrainingApp:
             ], spacing=10),
         )
 
-        dialog = ft.AlertDialog(
+        self._narration_dialog = ft.AlertDialog(
             modal=True,
             content=content,
             actions=[
-                ft.TextButton("Close", on_click=lambda _: self.close_dialog(dialog)),
+                ft.TextButton("Close", on_click=lambda _: self._close_narration_view()),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
         )
-        self.page.dialog = dialog
-        dialog.open = True
-        self.page.update()
+
+    def _close_narration_view(self):
+        """Close the narration viewer, remembering a changed font size."""
+        # Saved on close rather than per zoom click to avoid a config write each step
+        if self.narration_font_size != self.config.get_narration_font_size():
+            self.config.set_narration_font_size(self.narration_font_size)
+        self.close_dialog(self._narration_dialog)
 
     def on_tab_change(self, e):
         """Handle tab changes to show/hide app bar recording controls."""
         # Show app bar controls only on Record & Generate tab (index 0)
         self.appbar_recording_controls.visible = (e.control.selected_index == 0)
-        self.page.update()
+        self.appbar_recording_controls.update()
+
+        # Catch up on Dataset stats / training files skipped while hidden
+        if e.control.selected_index == 1 and self._dataset_stats_stale:
+            self.refresh_dataset_stats()
+        elif e.control.selected_index == 2 and self._training_files_stale:
+            self.refresh_training_files()
+        elif e.control.selected_index == 3:
+            self._load_settings_api_key()
+
+    def _load_settings_api_key(self):
+        """Fill the Settings tab API key field from the keyring on first view."""
+        if self._settings_api_key_loaded:
+            return
+        self._settings_api_key_loaded = True
+        self.settings_api_key_field.value = self.config.get_api_key() or ""
+        if self.settings_api_key_field.page:
+            self.settings_api_key_field.update()
 
     def _go_to_settings(self):
         """Navigate to settings tab."""
         self.tabs.selected_index = 3
+        self._load_settings_api_key()
         self.page.update()
 
     def toggle_theme(self):
@@ -1326,6 +1653,7 @@ class VoiceTrainingApp:
             self.appbar_status_label.value = "Paused"
         else:
             self.audio_recorder.resume_recording()
+            self._record_timer_wake.set()
             # Update main panel
             self.pause_btn.text = "Pause"
             self.pause_btn.icon = ICONS.PAUSE
@@ -1336,7 +1664,9 @@ class VoiceTrainingApp:
             self.appbar_pause_btn.icon = ICONS.PAUSE
             self.appbar_pause_btn.tooltip = "Pause recording"
             self.appbar_status_label.value = "Recording"
-        self.page.update()
+        # One message for all five state changes instead of one per control
+        self.page.update(self.pause_btn, self.status_label, self.duration_label,
+                         self.appbar_pause_btn, self.appbar_status_label)
 
     def stop_recording(self, e):
         """Stop recording."""
@@ -1345,6 +1675,7 @@ class VoiceTrainingApp:
 
         # Stop timer thread
         self._record_timer_stop.set()
+        self._record_timer_wake.set()
         if self._record_timer_thread and self._record_timer_thread.is_alive():
             try:
                 self._record_timer_thread.join(timeout=1.0)
@@ -1370,13 +1701,12 @@ class VoiceTrainingApp:
             return
 
         self.current_audio = audio
-        seconds = self.audio_recorder.get_duration(audio)
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
-        duration_text = f"{mins:02d}:{secs:02d}"
+        self._sample_dirty = True
+        self._start_disk_check()
+        duration_text, duration_label = _duration_texts(int(self.audio_recorder.get_duration(audio)))
 
         # Update main panel
-        self.duration_label.value = f"Duration: {duration_text}"
+        self.duration_label.value = duration_label
         self.duration_label.color = self.colors['success']
         self.status_label.value = "✓ Recording complete"
         self.status_label.color = self.colors['success']
@@ -1396,13 +1726,56 @@ class VoiceTrainingApp:
         self.appbar_stop_btn.visible = False
         self.appbar_retake_btn.visible = False
 
+        # Started after the status is set so a warning can't be overwritten by it
+        self._start_quality_check(audio)
+
         # Enable save if text exists
         self.check_save_enabled()
         self.page.update()
 
+    def _on_recording_limit(self):
+        """Stop a take that reached the length limit (called from the audio thread)."""
+        # The stream can't be stopped from its own callback, so hand off to the pool
+        self._io_pool.submit(self._stop_at_limit)
+
+    def _on_recording_warning(self, message):
+        """Show a non-fatal recorder problem (called from a recorder thread).
+
+        Args:
+            message: Warning from the recorder.
+        """
+        # Keep UI work off the recorder's threads
+        self._io_pool.submit(self._show_recording_warning, message)
+
+    def _show_recording_warning(self, message):
+        """Show a non-fatal recorder problem in the status label.
+
+        Args:
+            message: Warning from the recorder.
+        """
+        self.status_label.value = f"⚠ {message}"
+        self.status_label.color = self.colors['warning']
+        try:
+            self.status_label.update()
+        except Exception:
+            pass
+
+    def _stop_at_limit(self):
+        """Stop the take at the length limit and tell the user why."""
+        if not self.audio_recorder.is_recording:
+            return
+        self.stop_recording(None)
+        minutes = self.config.get_max_recording_minutes()
+        self.show_info_dialog(
+            "Recording Limit Reached",
+            f"Recording stopped at the {minutes:g}-minute limit. "
+            "Everything recorded up to the limit was kept.",
+        )
+
     def delete_recording(self, e):
         """Delete current recording."""
         self.current_audio = None
+        self._sample_dirty = True
         self.audio_recorder.clear_audio()
         self.duration_label.value = "Duration: 00:00"
         self.duration_label.color = self.colors['primary']
@@ -1417,6 +1790,7 @@ class VoiceTrainingApp:
         # Stop the timer thread if recording
         if self.audio_recorder.is_recording:
             self._record_timer_stop.set()
+            self._record_timer_wake.set()
             if self._record_timer_thread and self._record_timer_thread.is_alive():
                 try:
                     self._record_timer_thread.join(timeout=1.0)
@@ -1437,24 +1811,92 @@ class VoiceTrainingApp:
         # Start a new recording immediately
         self.start_recording(None)
 
+    def rescan_input_devices(self, e):
+        """Re-enumerate input devices and refresh both microphone dropdowns."""
+        try:
+            self.device_manager.rescan(stream_active=self.audio_recorder.is_recording)
+        except Exception as ex:
+            self.show_error_dialog("Audio Devices Unavailable", f"Could not list input devices: {ex}")
+            return
+        self._load_input_devices()
+        valid_keys = {key for key, _ in self._device_option_labels}
+
+        self.device_dropdown.options = [
+            ft.dropdown.Option(text=text, key=key) for key, text in self._device_option_labels
+        ]
+        if self.device_dropdown.value not in valid_keys:
+            self.device_dropdown.value = self._device_option_labels[0][0] if self._device_option_labels else None
+
+        mic_dropdown = self.settings_preferred_mic_dropdown
+        mic_dropdown.options = [ft.dropdown.Option(text="None (use system default)", key="none")]
+        mic_dropdown.options.extend([
+            ft.dropdown.Option(text=text, key=key) for key, text in self._device_option_labels
+        ])
+        if mic_dropdown.value not in valid_keys:
+            mic_dropdown.value = "none"
+
+        # Options are replaced wholesale and sent in one scoped update
+        self.page.update(self.device_dropdown, mic_dropdown)
+
     def test_microphone(self, e):
-        """Test the microphone."""
-        self.show_info_dialog("Test Mic", "Microphone test functionality to be implemented")
+        """Test the microphone by recording a short sample on the I/O pool."""
+        device_idx = None
+        if self.device_dropdown.value is not None:
+            try:
+                device_idx = int(self.device_dropdown.value)
+            except Exception:
+                device_idx = None
+
+        # Only the test button is disabled while the sample records
+        self.test_mic_btn.disabled = True
+        self.test_mic_btn.text = "Testing..."
+        self.test_mic_btn.update()
+
+        def on_done(future):
+            self.test_mic_btn.disabled = False
+            self.test_mic_btn.text = "Test Mic"
+            self.test_mic_btn.update()
+
+            recording = None if future.exception() else future.result()
+            if recording is None or len(recording) == 0:
+                self.show_error_dialog("Test Mic", "Could not record from the selected microphone.")
+                return
+            peak = float(abs(recording).max())
+            if peak < 0.01:
+                self.show_info_dialog("Test Mic", "No signal detected. Check that the microphone is unmuted.")
+            else:
+                self.show_info_dialog("Test Mic", f"Microphone is working (peak level {peak:.0%}).")
+
+        self._io_pool.submit(
+            self.device_manager.test_device,
+            device_idx,
+            duration=3.0,
+            sample_rate=self.audio_recorder.sample_rate,
+        ).add_done_callback(on_done)
 
     def open_settings(self):
         """Open settings dialog."""
-        # Fields populated from current config
-        current_base = str(self.config.get_base_path() or "")
-        current_api = self.config.get_api_key() or ""
-        current_model = self.config.get_openai_model()
-        current_rate = str(self.config.get_sample_rate())
-        current_auto = self.config.get_autogenerate_next()
-        current_goal = str(self.config.get_goal_duration())
+        if self._settings_dialog is None:
+            self._build_settings_dialog()
+
+        # Refresh fields from current config
+        self.base_path_field.value = str(self.config.get_base_path() or "")
+        self.api_key_field.value = self.config.get_api_key() or ""
+        self.model_dropdown.value = self.config.get_openai_model()
+        self.sample_rate_field.value = str(self.config.get_sample_rate())
+        self.auto_checkbox.value = self.config.get_autogenerate_next()
+        self.goal_duration_field.value = str(self.config.get_goal_duration())
+        self.settings_status.value = ""
+
+        self.page.dialog = self._settings_dialog
+        self._settings_dialog.open = True
+        self.page.update()
 
+    def _build_settings_dialog(self):
+        """Build the settings dialog once; values are refreshed on each open."""
         # Inputs
         self.base_path_field = ft.TextField(
             label="Base Path",
-            value=current_base,
             read_only=True,
             expand=True,
         )
@@ -1466,7 +1908,6 @@ class VoiceTrainingApp:
 
         self.api_key_field = ft.TextField(
             label="OpenAI API Key",
-            value=current_api,
             password=True,
             can_reveal_password=True,
             expand=True,
@@ -1474,30 +1915,22 @@ class VoiceTrainingApp:
 
         self.model_dropdown = ft.Dropdown(
             label="Model",
-            value=current_model,
-            options=[
-                ft.dropdown.Option("gpt-4o-mini"),
-                ft.dropdown.Option("gpt-4o"),
-                ft.dropdown.Option("gpt-4.1-mini"),
-            ],
+            options=self._model_options(),
             width=300,
         )
 
         self.sample_rate_field = ft.TextField(
             label="Sample Rate",
-            value=current_rate,
             width=200,
             keyboard_type=ft.KeyboardType.NUMBER,
         )
 
         self.auto_checkbox = ft.Checkbox(
             label="Auto-generate next sample after saving",
-            value=current_auto,
         )
 
         self.goal_duration_field = ft.TextField(
             label="Training Data Goal (minutes)",
-            value=current_goal,
             width=200,
             keyboard_type=ft.KeyboardType.NUMBER,
             hint_text="e.g., 60 for 1 hour",
@@ -1509,7 +1942,7 @@ class VoiceTrainingApp:
         def on_test(_):
             api_key = self.api_key_field.value.strip()
             model = self.model_dropdown.value
-            tg = TextGenerator(api_key, model)
+            tg = self._text_generator_for(api_key, model)
             ok, err = tg.test_connection()
             if ok:
                 self.settings_status.value = "API connection successful"
@@ -1520,49 +1953,45 @@ class VoiceTrainingApp:
             self.page.update()
 
         def on_save(_):
-            # Persist config
-            base = self.base_path_field.value.strip()
-            if base:
-                self.config.set_base_path(Path(base))
-                # Re-init sample manager and stats
-                self.sample_manager = SampleManager(Path(base))
-                self.refresh_statistics()
-            # API key and model
-            self.config.set_api_key(self.api_key_field.value.strip())
-            self.config.set_openai_model(self.model_dropdown.value)
-            # Sample rate
-            try:
-                rate = int(self.sample_rate_field.value)
-                if rate > 0:
-                    self.config.set_sample_rate(rate)
-                    self.audio_recorder.sample_rate = rate
-            except Exception:
-                pass
-            # Autogenerate setting
-            self.config.set_autogenerate_next(self.auto_checkbox.value)
-            self.autogenerate_checkbox.value = self.auto_checkbox.value
-            # Goal duration
-            try:
-                goal = float(self.goal_duration_field.value)
-                if goal > 0:
-                    self.config.set_goal_duration(goal)
-            except Exception:
-                pass
+            # Persist config in a single write
+            with self.config.batch():
+                base = self.base_path_field.value.strip()
+                if base:
+                    self.config.set_base_path(Path(base))
+                    # Re-init sample manager and stats
+                    self.sample_manager = SampleManager(Path(base))
+                    self.refresh_statistics()
+                    self.refresh_training_files()
+                # API key and model
+                self.config.set_api_key(self.api_key_field.value.strip())
+                self.config.set_openai_model(self.model_dropdown.value)
+                # Sample rate
+                try:
+                    rate = int(self.sample_rate_field.value)
+                    if rate > 0:
+                        self.config.set_sample_rate(rate)
+                        self.audio_recorder.sample_rate = rate
+                except Exception:
+                    pass
+                # Autogenerate setting
+                self.config.set_autogenerate_next(self.auto_checkbox.value)
+                self.autogenerate_checkbox.value = self.auto_checkbox.value
+                # Goal duration
+                try:
+                    goal = float(self.goal_duration_field.value)
+                    if goal > 0:
+                        self.config.set_goal_duration(goal)
+                except Exception:
+                    pass
 
-            # Update status bar and text generator
+            # Update status bar (text generator is rebuilt lazily if key/model changed)
             self.status_bar.value = self.get_status_text()
-            try:
-                api_key = self.config.get_api_key() or ""
-                model = self.config.get_openai_model()
-                self.text_generator = TextGenerator(api_key, model)
-            except Exception:
-                pass
 
-            self.close_dialog(settings_dialog)
+            self.close_dialog(self._settings_dialog)
             # Also refresh dataset tab stats
             self.refresh_dataset_stats()
 
-        settings_dialog = ft.AlertDialog(
+        self._settings_dialog = ft.AlertDialog(
             title=ft.Text("Settings"),
             content=ft.Column(
                 [
@@ -1588,17 +2017,13 @@ class VoiceTrainingApp:
                 scroll=ft.ScrollMode.AUTO,
             ),
             actions=[
-                ft.TextButton("Cancel", on_click=lambda _: self.close_dialog(settings_dialog)),
+                ft.TextButton("Cancel", on_click=lambda _: self.close_dialog(self._settings_dialog)),
                 ft.ElevatedButton("Save", icon=ICONS.SAVE, on_click=on_save),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
             on_dismiss=lambda _: None,
         )
 
-        self.page.dialog = settings_dialog
-        settings_dialog.open = True
-        self.page.update()
-
     def get_status_text(self):
         """Get status bar text."""
         if self.config.is_configured():
@@ -1627,50 +2052,154 @@ class VoiceTrainingApp:
         """Handle directory selection from picker."""
         if e.path:
             # Update settings tab field if it exists
-            if hasattr(self, 'settings_base_path_field'):
+            if self.settings_base_path_field is not None:
                 self.settings_base_path_field.value = e.path
             # Update old dialog field if it exists
-            if hasattr(self, 'base_path_field'):
+            if self.base_path_field is not None:
                 self.base_path_field.value = e.path
             self.page.update()
 
+    def _ensure_samples_scanned(self, refresh) -> bool:
+        """Check that sample stats are cached, scanning in the background if not.
+
+        Args:
+            refresh: Callback to re-run once the background scan completes.
+
+        Returns:
+            True if stats can be computed now without touching disk.
+        """
+        if self.sample_manager.is_cache_fresh():
+            return True
+
+        manager = self.sample_manager
+        with self._scan_lock:
+            if refresh not in self._scan_refreshes:
+                self._scan_refreshes.append(refresh)
+            if self._scan_future is not None and not self._scan_future.done():
+                return False
+            future = self._io_pool.submit(manager.get_all_samples)
+            self._scan_future = future
+
+        def on_done(future):
+            with self._scan_lock:
+                refreshes, self._scan_refreshes = self._scan_refreshes, []
+            error = future.exception()
+            if error is not None:
+                self._show_scan_error(error)
+                return
+            # Refreshes re-check the current manager, so one replaced while
+            # scanning simply starts its own scan
+            for callback in refreshes:
+                callback()
+
+        # Registered once per scan, so each waiting refresh runs once
+        future.add_done_callback(on_done)
+        return False
+
+    def _show_scan_error(self, error):
+        """Replace the "…" stat placeholders and report a failed background scan.
+
+        Args:
+            error: Exception raised by the scan.
+        """
+        self.total_label.value = "Total: unavailable"
+        self.duration_stats_label.value = "Total Duration: unavailable"
+        self.dataset_count_label.value = "Notes saved: unavailable"
+        self.dataset_minutes_label.value = "Minutes recorded: unavailable"
+        self.show_error_dialog("Scan Failed", f"Could not read the saved samples: {error}")
+
+    def _wait_for_samples_scan(self):
+        """Let a running background scan finish before scanning in the foreground.
+
+        The foreground pass then reads the scan's cached results instead of
+        loading every sample a second time alongside it.
+        """
+        future = self._scan_future
+        if future is not None and not future.done():
+            try:
+                future.result()
+            except Exception:
+                pass  # the foreground pass rescans and reports errors itself
+
     def refresh_statistics(self):
         """Refresh statistics labels from sample manager."""
-        total_samples = self.sample_manager.get_total_samples()
-        total_duration = self.sample_manager.estimate_total_duration(self.audio_recorder.sample_rate)
-        self.total_label.value = f"Total: {total_samples} samples"
-        self.duration_stats_label.value = f"Total Duration: {total_duration:.1f} min"
-        self.page.update()
+        if not self._ensure_samples_scanned(self.refresh_statistics):
+            self.total_label.value = "Total: … samples"
+            self.duration_stats_label.value = "Total Duration: … min"
+            self._maybe_update()
+            return
+
+        total_samples, total_duration = self.sample_manager.get_totals(self.audio_recorder.sample_rate)
+
+        # Only push labels whose text actually changed
+        changed = False
+        for label, text in (
+            (self.total_label, f"Total: {total_samples} samples"),
+            (self.duration_stats_label, f"Total Duration: {total_duration:.1f} min"),
+        ):
+            if label.value != text:
+                label.value = text
+                changed = True
+        if changed:
+            self._maybe_update()
 
     def refresh_dataset_stats(self):
         """Refresh Dataset tab stats."""
+        # Defer while the Dataset tab (index 1) is hidden; on_tab_change catches up
+        tabs = getattr(self, 'tabs', None)
+        if tabs is not None and tabs.selected_index != 1:
+            self._dataset_stats_stale = True
+            return
+        self._dataset_stats_stale = False
+
         base = str(self.config.get_base_path() or "(not set)")
-        self.dataset_base_label.value = f"Base Path: {base}"
-        total_samples = self.sample_manager.get_total_samples()
-        total_minutes = self.sample_manager.estimate_total_duration(self.audio_recorder.sample_rate)
-        self.dataset_count_label.value = f"Notes saved: {total_samples}"
-        self.dataset_minutes_label.value = f"Minutes recorded: {total_minutes:.1f}"
+        if not self._ensure_samples_scanned(self.refresh_dataset_stats):
+            self.dataset_base_label.value = f"Base Path: {base}"
+            self.dataset_count_label.value = "Notes saved: …"
+            self.dataset_minutes_label.value = "Minutes recorded: …"
+            self._last_stats_key = None
+            self._maybe_update()
+            return
 
-        # Update goal progress
+        total_samples, total_minutes = self.sample_manager.get_totals(self.audio_recorder.sample_rate)
         goal_minutes = self.config.get_goal_duration()
+
+        # Nothing visible changed since the last refresh (totals at 0.1 min resolution)
+        stats_key = (base, total_samples, round(total_minutes, 1), goal_minutes)
+        if stats_key == self._last_stats_key:
+            return
+        self._last_stats_key = stats_key
+
+        for label, text in (
+            (self.dataset_base_label, f"Base Path: {base}"),
+            (self.dataset_count_label, f"Notes saved: {total_samples}"),
+            (self.dataset_minutes_label, f"Minutes recorded: {total_minutes:.1f}"),
+        ):
+            if label.value != text:
+                label.value = text
+
+        # Update goal progress
         progress_pct = min((total_minutes / goal_minutes * 100) if goal_minutes > 0 else 0, 100)
         progress_value = min(total_minutes / goal_minutes if goal_minutes > 0 else 0, 1.0)
 
         self.goal_progress_bar.value = progress_value
-        self.goal_progress_label.value = f"Goal: {total_minutes:.1f} / {goal_minutes:.1f} minutes ({progress_pct:.1f}%)"
+        goal_text = f"Goal: {total_minutes:.1f} / {goal_minutes:.1f} minutes ({progress_pct:.1f}%)"
+        if self.goal_progress_label.value != goal_text:
+            self.goal_progress_label.value = goal_text
 
-        # Change color based on progress
+        # Change color based on progress (only when the band changes)
         if progress_pct >= 100:
-            self.goal_progress_bar.color = COLORS.GREEN_700
-            self.goal_progress_label.color = COLORS.GREEN_700
+            progress_color = self._goal_color_done
         elif progress_pct >= 50:
-            self.goal_progress_bar.color = COLORS.BLUE_700
-            self.goal_progress_label.color = COLORS.BLUE_700
+            progress_color = self._goal_color_half
         else:
-            self.goal_progress_bar.color = COLORS.ORANGE_700
-            self.goal_progress_label.color = COLORS.ORANGE_700
+            progress_color = self._goal_color_low
+        if progress_color != self._last_progress_color:
+            self.goal_progress_bar.color = progress_color
+            self.goal_progress_label.color = progress_color
+            self._last_progress_color = progress_color
 
-        self.page.update()
+        self._maybe_update()
 
     def open_dataset_folder(self):
         """Open the dataset base path in the file manager."""
@@ -1684,42 +2213,81 @@ class VoiceTrainingApp:
             self.show_error_dialog("Path Not Found", f"The base path does not exist:\n{base_path}")
             return
 
-        try:
-            system = platform.system()
-            if system == "Linux":
-                subprocess.Popen(["xdg-open", str(base_path)])
-            elif system == "Darwin":  # macOS
-                subprocess.Popen(["open", str(base_path)])
-            elif system == "Windows":
-                subprocess.Popen(["explorer", str(base_path)])
-            else:
-                self.show_error_dialog("Unsupported OS", f"Cannot open folder on {system}")
-        except Exception as ex:
-            self.show_error_dialog("Error Opening Folder", str(ex))
+        system = platform.system()
+        if system == "Linux":
+            self._launch_external(["xdg-open", str(base_path)], "Error Opening Folder")
+        elif system == "Darwin":  # macOS
+            self._launch_external(["open", str(base_path)], "Error Opening Folder")
+        elif system == "Windows":
+            self._launch_external(["explorer", str(base_path)], "Error Opening Folder")
+        else:
+            self.show_error_dialog("Unsupported OS", f"Cannot open folder on {system}")
+
+    def _launch_external(self, cmd, error_title: str, shell: bool = False):
+        """Launch an external program without blocking the UI thread.
+
+        Args:
+            cmd: Command to run.
+            error_title: Title of the error dialog shown if the launch fails.
+            shell: Whether to run the command through the shell.
+        """
+        def launch():
+            subprocess.Popen(cmd, shell=shell, close_fds=True, start_new_session=True)
+
+        def on_done(future):
+            ex = future.exception()
+            if ex is not None:
+                self.show_error_dialog(error_title, str(ex))
+
+        self._io_pool.submit(launch).add_done_callback(on_done)
 
     def refresh_training_files(self):
         """Refresh the training files list."""
+        # Defer while the Training Files tab (index 2) is hidden; on_tab_change catches up
+        tabs = getattr(self, 'tabs', None)
+        if tabs is None or tabs.selected_index != 2:
+            self._training_files_stale = True
+            return
+        self._training_files_stale = False
+
         try:
-            samples = self.sample_manager.get_all_samples()
+            self._wait_for_samples_scan()
+
+            # Paint progressively when starting from an empty list (e.g. first load)
+            progressive = not self._sample_cards
+
+            # Reuse cards for unchanged samples; only build new or changed ones
+            cards = {}
+            controls = []
+            total_duration = 0.0
+            for sample in self.sample_manager.iter_samples():
+                key = (sample['number'], sample.get('duration', 0), sample.get('text_content'))
+                card = self._sample_cards.get(key)
+                if card is None:
+                    card = self.create_sample_card(sample)
+                cards[key] = card
+                controls.append(card)
+                total_duration += sample.get('duration', 0)
+
+                if progressive and len(controls) % self.FILES_RENDER_CHUNK == 0:
+                    self.files_list.controls[:] = controls
+                    self._maybe_update()
+            self._sample_cards = cards
 
             # Update stats
-            total_duration = sum(s.get('duration', 0) for s in samples)
-            self.files_stats_label.value = f"Total samples: {len(samples)} | Total duration: {total_duration:.1f}s ({total_duration/60:.1f} min)"
+            self.files_stats_label.value = f"Total samples: {len(controls)} | Total duration: {total_duration:.1f}s ({total_duration/60:.1f} min)"
 
-            # Clear existing list
-            self.files_list.controls.clear()
+            if not controls:
+                controls = [self.files_empty_text]
 
-            if not samples:
-                self.files_list.controls.append(
-                    ft.Text("No training files found. Start recording to create samples!",
-                           size=14, italic=True, color=COLORS.GREY_600)
-                )
-            else:
-                # Add each sample as a card
-                for sample in samples:
-                    self.files_list.controls.append(self.create_sample_card(sample))
+            # Nothing changed: skip the list swap and page diff entirely
+            if controls == self.files_list.controls:
+                return
 
-            self.page.update()
+            # Swap the whole list in one slice assignment
+            self.files_list.controls[:] = controls
+
+            self._maybe_update()
 
         except Exception as e:
             self.show_error_dialog("Error Loading Files", str(e))
@@ -1734,18 +2302,25 @@ class VoiceTrainingApp:
             Card widget.
         """
         sample_num = sample['number']
-        duration = sample.get('duration', 0)
-        text_content = sample.get('text_content', '(no text)')
-
-        # Truncate text for display
-        display_text = text_content[:120] + "..." if len(text_content) > 120 else text_content
+        colors = self.colors
+
+        # Display strings are cached on the sample dict; SampleManager hands out
+        # fresh dicts whenever samples change on disk, so they never go stale
+        if '_badge_text' not in sample:
+            duration = sample.get('duration', 0)
+            text_content = sample.get('text_content', '(no text)')
+            sample['_badge_text'] = f"#{sample_num:03d}"
+            sample['_duration_text'] = f"{duration:.1f}s"
+            # Truncate text for display
+            sample['_display_text'] = text_content[:120] + "..." if len(text_content) > 120 else text_content
+        display_text = sample['_display_text']
 
         # Play button
         play_btn = ft.IconButton(
             icon=ICONS.PLAY_CIRCLE,
             tooltip="Play audio sample",
             on_click=lambda _: self.play_sample_audio(sample),
-            icon_color=self.colors['primary'],
+            icon_color=colors['primary'],
             icon_size=32,
         )
 
@@ -1754,19 +2329,19 @@ class VoiceTrainingApp:
             icon=ICONS.DELETE_OUTLINE,
             tooltip="Delete this sample",
             on_click=lambda _: self.confirm_delete_sample(sample_num),
-            icon_color=self.colors['error'],
+            icon_color=colors['error'],
             icon_size=28,
         )
 
         # Sample badge
         badge = ft.Container(
             content=ft.Text(
-                f"#{sample_num:03d}",
+                sample['_badge_text'],
                 size=12,
                 weight=ft.FontWeight.BOLD,
                 color=COLORS.WHITE,
             ),
-            bgcolor=self.colors['primary'],
+            bgcolor=colors['primary'],
             border_radius=12,
             padding=ft.padding.symmetric(horizontal=10, vertical=4),
         )
@@ -1777,9 +2352,9 @@ class VoiceTrainingApp:
                 ft.Row([
                     badge,
                     ft.Text(
-                        f"{duration:.1f}s",
+                        sample['_duration_text'],
                         size=13,
-                        color=self.colors['text_secondary'],
+                        color=colors['text_secondary'],
                         weight=ft.FontWeight.W_500,
                     ),
                 ], spacing=12),
@@ -1787,7 +2362,7 @@ class VoiceTrainingApp:
                 ft.Text(
                     display_text,
                     size=13,
-                    color=self.colors['text_primary'],
+                    color=colors['text_primary'],
                     max_lines=2,
                     overflow=ft.TextOverflow.ELLIPSIS,
                 ),
@@ -1812,7 +2387,7 @@ class VoiceTrainingApp:
                 padding=16,
             ),
             elevation=2,
-            surface_tint_color=self.colors['primary_light'],
+            surface_tint_color=colors['primary_light'],
         )
 
     def play_sample_audio(self, sample: dict):
@@ -1822,7 +2397,7 @@ class VoiceTrainingApp:
             sample: Sample info dictionary.
         """
         audio_path = sample.get('audio_path')
-        if not audio_path or not Path(audio_path).exists():
+        if not audio_path or not os.path.isfile(audio_path):
             self.show_error_dialog("No Audio", "Audio file not found for this sample.")
             return
 
@@ -1844,25 +2419,38 @@ class VoiceTrainingApp:
         duration = sample.get('duration', 0)
         text_content = sample.get('text_content', '(no text)')
 
-        # Convert file path to proper URI format for Flet
-        audio_file_path = Path(audio_path).resolve()
-        audio_uri = f"file://{audio_file_path}"
-
-        # Create audio player
-        self.audio_player = ft.Audio(
-            src=audio_uri,
-            autoplay=True,
-            volume=1.0,
-            on_duration_changed=lambda e: self.update_audio_duration(e),
-            on_position_changed=lambda e: self.update_audio_position(e),
-            on_state_changed=lambda e: self.update_audio_state(e),
-        )
-        self.page.overlay.append(self.audio_player)
+        # Convert file path to proper URI format for Flet (cached for replays).
+        # abspath is purely lexical: sample paths come from SampleManager and
+        # don't rely on symlink resolution, so Path.resolve()'s stats are skipped.
+        audio_uri = sample.get('_resolved_uri')
+        if audio_uri is None:
+            audio_uri = "file://" + os.path.abspath(os.fspath(audio_path))
+            sample['_resolved_uri'] = audio_uri
+
+        # Create the audio player once and keep it in the overlay; later plays
+        # just swap its source, and autoplay starts it once the client has
+        # loaded it. Only a replay of the loaded clip needs an explicit play().
+        replay = self.audio_player is not None and self.audio_player.src == audio_uri
+        if self.audio_player is None:
+            self.audio_player = ft.Audio(
+                src=audio_uri,
+                autoplay=True,
+                volume=1.0,
+                on_duration_changed=lambda e: self.update_audio_duration(e),
+                on_position_changed=lambda e: self.update_audio_position(e),
+                on_state_changed=lambda e: self.update_audio_state(e),
+            )
+            self.page.overlay.append(self.audio_player)
+        else:
+            self.audio_player.src = audio_uri
+            self.audio_player.volume = 1.0
 
         # Playback state
         self.audio_is_playing = True
         self.audio_duration = duration
         self.audio_position = 0.0
+        self._last_pos_update_ms = 0
+        self._last_time_key = None
 
         # Play/Pause button
         self.play_pause_btn = ft.IconButton(
@@ -1946,6 +2534,8 @@ class VoiceTrainingApp:
         self.page.dialog = dialog
         dialog.open = True
         self.page.update()
+        if replay:
+            self.audio_player.play()
 
     def toggle_audio_playback(self):
         """Toggle audio playback between play and pause."""
@@ -1980,22 +2570,34 @@ class VoiceTrainingApp:
         """Update audio position during playback."""
         if e.data:
             try:
+                # Throttle to roughly one update per animation frame
+                now_ms = time.monotonic_ns() // 1_000_000
+                if now_ms - self._last_pos_update_ms < 16:
+                    return
+                self._last_pos_update_ms = now_ms
+
                 position_ms = float(e.data)
                 self.audio_position = position_ms / 1000  # Convert ms to seconds
+                changed = False
 
                 # Update progress bar
                 if self.audio_duration > 0:
-                    progress = self.audio_position / self.audio_duration
-                    self.audio_progress.value = min(progress, 1.0)
-
-                # Update time label
-                pos_mins = int(self.audio_position // 60)
-                pos_secs = int(self.audio_position % 60)
-                dur_mins = int(self.audio_duration // 60)
-                dur_secs = int(self.audio_duration % 60)
-                self.audio_time_label.value = f"{pos_mins}:{pos_secs:02d} / {dur_mins}:{dur_secs:02d}"
-
-                self.page.update()
+                    progress = min(self.audio_position / self.audio_duration, 1.0)
+                    if abs(progress - (self.audio_progress.value or 0)) > 0.005:
+                        self.audio_progress.value = progress
+                        changed = True
+
+                # Update time label only when the displayed seconds change
+                time_key = (int(self.audio_position), int(self.audio_duration))
+                if time_key != self._last_time_key:
+                    self._last_time_key = time_key
+                    pos_mins, pos_secs = divmod(time_key[0], 60)
+                    dur_mins, dur_secs = divmod(time_key[1], 60)
+                    self.audio_time_label.value = f"{pos_mins}:{pos_secs:02d} / {dur_mins}:{dur_secs:02d}"
+                    changed = True
+
+                if changed:
+                    self._maybe_update()
             except Exception:
                 pass
 
@@ -2012,10 +2614,8 @@ class VoiceTrainingApp:
         if self.audio_player:
             try:
                 self.audio_player.pause()
-                self.page.overlay.remove(self.audio_player)
             except Exception:
                 pass
-            self.audio_player = None
 
         self.current_playing_sample = None
         dialog.open = False
@@ -2029,18 +2629,14 @@ class VoiceTrainingApp:
             error: Error message from in-app player.
         """
         def play_in_system(_):
-            try:
-                system = platform.system()
-                if system == "Linux":
-                    subprocess.Popen(["xdg-open", audio_path])
-                elif system == "Darwin":  # macOS
-                    subprocess.Popen(["open", audio_path])
-                elif system == "Windows":
-                    subprocess.Popen(["start", audio_path], shell=True)
-                self.close_dialog(dialog)
-            except Exception as ex:
-                self.close_dialog(dialog)
-                self.show_error_dialog("Error", f"Failed to open audio file: {ex}")
+            self.close_dialog(dialog)
+            system = platform.system()
+            if system == "Linux":
+                self._launch_external(["xdg-open", audio_path], "Error")
+            elif system == "Darwin":  # macOS
+                self._launch_external(["open", audio_path], "Error")
+            elif system == "Windows":
+                self._launch_external(["start", audio_path], "Error", shell=True)
 
         dialog = ft.AlertDialog(
             title=ft.Text("Audio Player Error"),
@@ -2069,20 +2665,26 @@ class VoiceTrainingApp:
         Args:
             sample_num: Sample number to delete.
         """
-        dialog = ft.AlertDialog(
-            title=ft.Text("Confirm Delete"),
-            content=ft.Text(
-                f"Are you sure you want to delete sample #{sample_num:03d}?\n\n"
-                "This will permanently delete the sample and renumber all subsequent samples."
-            ),
-            actions=[
-                ft.TextButton("Cancel", on_click=lambda _: self.close_dialog(dialog)),
-                ft.TextButton(
-                    "Delete",
-                    on_click=lambda _: self.delete_sample(sample_num, dialog),
-                    style=ft.ButtonStyle(color=COLORS.RED_700),
-                ),
-            ],
+        if self._confirm_delete_dialog is None:
+            dialog = ft.AlertDialog(
+                title=ft.Text("Confirm Delete"),
+                content=ft.Text(""),
+                actions=[
+                    ft.TextButton("Cancel", on_click=lambda _: self.close_dialog(dialog)),
+                    ft.TextButton(
+                        "Delete",
+                        on_click=lambda _: self.delete_sample(self._pending_delete_num, dialog),
+                        style=ft.ButtonStyle(color=COLORS.RED_700),
+                    ),
+                ],
+            )
+            self._confirm_delete_dialog = dialog
+
+        dialog = self._confirm_delete_dialog
+        self._pending_delete_num = sample_num
+        dialog.content.value = (
+            f"Are you sure you want to delete sample #{sample_num:03d}?\n\n"
+            "This will permanently delete the sample and renumber all subsequent samples."
         )
         self.page.dialog = dialog
         dialog.open = True
@@ -2099,9 +2701,13 @@ class VoiceTrainingApp:
             success, error = self.sample_manager.delete_sample(sample_num)
 
             if success:
+                # Send the close on its own: opening the next dialog replaces
+                # page.dialog, so a shared flush would drop open=False
                 self.close_dialog(dialog)
-                self.refresh_training_files()
-                self.refresh_dataset_stats()
+                with self._batch_updates():
+                    self.refresh_training_files()
+                    self.refresh_statistics()
+                    self.refresh_dataset_stats()
                 self.show_info_dialog(
                     "Sample Deleted",
                     f"Sample #{sample_num:03d} has been deleted and subsequent samples have been renumbered."
@@ -2114,67 +2720,91 @@ class VoiceTrainingApp:
             self.close_dialog(dialog)
             self.show_error_dialog("Delete Failed", str(e))
 
-    def show_info_dialog(self, title, message):
-        """Show info dialog."""
+    def _build_message_dialog(self):
+        """Build a reusable title/message dialog with an OK button."""
         dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
+            title=ft.Text(""),
+            content=ft.Text(""),
             actions=[
                 ft.TextButton("OK", on_click=lambda _: self.close_dialog(dialog)),
             ],
         )
+        return dialog
+
+    def _show_message_dialog(self, dialog, title, message):
+        """Show a reusable message dialog with new title and message."""
+        dialog.title.value = title
+        dialog.content.value = message
         self.page.dialog = dialog
         dialog.open = True
-        self.page.update()
+        self._maybe_update()
+
+    def show_info_dialog(self, title, message):
+        """Show info dialog."""
+        self._show_message_dialog(self._info_dialog, title, message)
 
     def show_error_dialog(self, title, message):
         """Show error dialog."""
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[
-                ft.TextButton("OK", on_click=lambda _: self.close_dialog(dialog)),
-            ],
-        )
-        self.page.dialog = dialog
-        dialog.open = True
-        self.page.update()
+        self._show_message_dialog(self._error_dialog, title, message)
 
     def show_about(self):
         """Show about dialog."""
-        dialog = ft.AlertDialog(
-            title=ft.Text("About Voice Training Data Creator"),
-            content=ft.Column(
-                [
-                    ft.Text("Version 1.0", weight=ft.FontWeight.BOLD),
-                    ft.Text("A GUI tool for creating voice training datasets."),
-                    ft.Divider(),
-                    ft.Text("Features:", weight=ft.FontWeight.BOLD),
-                    ft.Text("• High-quality audio recording"),
-                    ft.Text("• AI-powered text generation"),
-                    ft.Text("• Multiple style options"),
-                    ft.Text("• Custom vocabulary support"),
+        if self._about_dialog is None:
+            dialog = ft.AlertDialog(
+                title=ft.Text("About Voice Training Data Creator"),
+                content=ft.Column(
+                    [
+                        ft.Text("Version 1.0", weight=ft.FontWeight.BOLD),
+                        ft.Text("A GUI tool for creating voice training datasets."),
+                        ft.Divider(),
+                        ft.Text("Features:", weight=ft.FontWeight.BOLD),
+                        ft.Text("• High-quality audio recording"),
+                        ft.Text("• AI-powered text generation"),
+                        ft.Text("• Multiple style options"),
+                        ft.Text("• Custom vocabulary support"),
+                    ],
+                    tight=True,
+                ),
+                actions=[
+                    ft.TextButton("OK", on_click=lambda _: self.close_dialog(dialog)),
                 ],
-                tight=True,
-            ),
-            actions=[
-                ft.TextButton("OK", on_click=lambda _: self.close_dialog(dialog)),
-            ],
-        )
-        self.page.dialog = dialog
-        dialog.open = True
+            )
+            self._about_dialog = dialog
+
+        self.page.dialog = self._about_dialog
+        self._about_dialog.open = True
         self.page.update()
 
+    @contextmanager
+    def _batch_updates(self):
+        """Suppress page updates inside the block and flush once on exit."""
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0:
+                self.page.update()
+
+    def _maybe_update(self):
+        """Update the page unless a batch update is in progress."""
+        if self._update_depth == 0:
+            self.page.update()
+
     def close_dialog(self, dialog):
         """Close a dialog."""
         dialog.open = False
-        self.page.update()
+        self._maybe_update()
 
 
 def main(page: ft.Page):
     """Main entry point for Flet app."""
+    page.on_close = lambda _: _close_llm_client()
     VoiceTrainingApp(page)
 
 
 if __name__ == "__main__":
-    ft.app(target=main)
+    try:
+        ft.app(target=main)
+    finally:
+        _close_llm_client()
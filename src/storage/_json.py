@@ -0,0 +1,32 @@
+"""JSON encoding for the config and sample files, using orjson when available."""
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(data: Any) -> bytes:
+        """Serialize data to indented JSON bytes.
+
+        Args:
+            data: JSON-serializable data.
+
+        Returns:
+            UTF-8 encoded JSON.
+        """
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib
+    def dumps(data: Any) -> bytes:
+        """Serialize data to indented JSON bytes.
+
+        Args:
+            data: JSON-serializable data.
+
+        Returns:
+            UTF-8 encoded JSON.
+        """
+        return json.dumps(data, indent=2).encode('utf-8')
+
+    loads = json.loads
@@ -1,9 +1,13 @@
 """Application configuration management."""
-import json
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import keyring
 
+from ._json import dumps, loads
+
 
 class ConfigManager:
     """Manages application configuration and settings."""
@@ -24,20 +28,25 @@ class ConfigManager:
         "preferred_device_index": None,
         "preferred_device_name": None,
         "autogenerate_next": False,
-        "goal_duration_minutes": 60.0
+        "goal_duration_minutes": 60.0,
+        "max_recording_minutes": 30.0,
+        "narration_font_size": 22
     }
 
     def __init__(self):
         """Initialize configuration manager."""
         self._config: Dict[str, Any] = {}
+        self._dirty = False
+        self._batch_depth = 0
+        # (loaded, value) cache for the keyring API key lookup
+        self._api_key_cache: Tuple[bool, Optional[str]] = (False, None)
         self._load_config()
 
     def _load_config(self):
         """Load configuration from file."""
         if self.CONFIG_FILE.exists():
             try:
-                with open(self.CONFIG_FILE, 'r') as f:
-                    self._config = json.load(f)
+                self._config = loads(self.CONFIG_FILE.read_bytes())
             except Exception as e:
                 print(f"Error loading config: {e}")
                 self._config = self.DEFAULTS.copy()
@@ -45,14 +54,40 @@ class ConfigManager:
             self._config = self.DEFAULTS.copy()
 
     def _save_config(self):
-        """Save configuration to file."""
+        """Save configuration to file atomically."""
         try:
             self.CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            with tempfile.NamedTemporaryFile(
+                'wb', dir=self.CONFIG_FILE.parent, prefix=".config-", suffix=".tmp", delete=False
+            ) as f:
+                f.write(dumps(self._config))
+            os.replace(f.name, self.CONFIG_FILE)
+            self._dirty = False
         except Exception as e:
             print(f"Error saving config: {e}")
 
+    def flush(self):
+        """Write pending configuration changes to disk."""
+        if self._dirty:
+            self._save_config()
+
+    @contextmanager
+    def batch(self):
+        """Defer config writes until the outermost batch exits.
+
+        Example:
+            with config.batch():
+                config.set_sample_rate(48000)
+                config.set_goal_duration(90.0)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value.
 
@@ -73,7 +108,9 @@ class ConfigManager:
             value: Value to set.
         """
         self._config[key] = value
-        self._save_config()
+        self._dirty = True
+        if self._batch_depth == 0:
+            self._save_config()
 
     def get_base_path(self) -> Optional[Path]:
         """Get the base path for storing samples.
@@ -97,15 +134,34 @@ class ConfigManager:
     def get_api_key(self) -> Optional[str]:
         """Get OpenAI API key from secure storage.
 
+        The keyring is only queried on first use; later calls return the
+        cached value until the key is changed or refreshed.
+
         Returns:
             API key or None if not set.
         """
+        loaded, api_key = self._api_key_cache
+        if loaded:
+            return api_key
+
         try:
-            return keyring.get_password(self.APP_NAME, "openai_api_key")
+            api_key = keyring.get_password(self.APP_NAME, "openai_api_key")
         except Exception as e:
             print(f"Error retrieving API key: {e}")
             return None
 
+        self._api_key_cache = (True, api_key)
+        return api_key
+
+    def refresh_api_key(self) -> Optional[str]:
+        """Re-read the API key from secure storage, bypassing the cache.
+
+        Returns:
+            API key or None if not set.
+        """
+        self._api_key_cache = (False, None)
+        return self.get_api_key()
+
     def set_api_key(self, api_key: str):
         """Store OpenAI API key securely.
 
@@ -114,6 +170,7 @@ class ConfigManager:
         """
         try:
             keyring.set_password(self.APP_NAME, "openai_api_key", api_key)
+            self._api_key_cache = (True, api_key)
         except Exception as e:
             print(f"Error storing API key: {e}")
 
@@ -121,6 +178,7 @@ class ConfigManager:
         """Delete stored API key."""
         try:
             keyring.delete_password(self.APP_NAME, "openai_api_key")
+            self._api_key_cache = (True, None)
         except Exception as e:
             print(f"Error deleting API key: {e}")
 
@@ -171,8 +229,9 @@ class ConfigManager:
             device_index: Index of the preferred device.
             device_name: Name of the preferred device.
         """
-        self.set("preferred_device_index", device_index)
-        self.set("preferred_device_name", device_name)
+        with self.batch():
+            self.set("preferred_device_index", device_index)
+            self.set("preferred_device_name", device_name)
 
     def get_autogenerate_next(self) -> bool:
         """Get autogenerate next sample setting.
@@ -205,3 +264,35 @@ class ConfigManager:
             minutes: Goal duration in minutes.
         """
         self.set("goal_duration_minutes", minutes)
+
+    def get_max_recording_minutes(self) -> float:
+        """Get the longest single take; recording stops when it is reached.
+
+        Returns:
+            Maximum recording length in minutes.
+        """
+        return self.get("max_recording_minutes", self.DEFAULTS["max_recording_minutes"])
+
+    def set_max_recording_minutes(self, minutes: float):
+        """Set the longest single take; recording stops when it is reached.
+
+        Args:
+            minutes: Maximum recording length in minutes.
+        """
+        self.set("max_recording_minutes", minutes)
+
+    def get_narration_font_size(self) -> int:
+        """Get the narration viewer font size.
+
+        Returns:
+            Font size in points.
+        """
+        return self.get("narration_font_size", self.DEFAULTS["narration_font_size"])
+
+    def set_narration_font_size(self, size: int):
+        """Set the narration viewer font size.
+
+        Args:
+            size: Font size in points.
+        """
+        self.set("narration_font_size", size)
@@ -1,13 +1,136 @@
 """Sample storage and management."""
 from pathlib import Path
-from typing import Optional, Tuple, List
-import json
+from typing import Optional, Tuple, List, Iterator, Dict, Callable
+import os
+import shutil
+import struct
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import numpy as np
+
+from ._json import dumps, loads
+
+try:
+    import soundfile as sf
+except ImportError:  # only needed for audio the header parser can't handle
+    sf = None
+
+# Size of a WAV header with only a 16-byte "fmt " chunk before "data"
+_CANONICAL_HEADER_SIZE = 44
+
+
+def _read_wav_duration(audio_file: Path) -> Optional[float]:
+    """Read a WAV file's duration straight from its RIFF header.
+
+    Args:
+        audio_file: Path to the WAV file.
+
+    Returns:
+        Duration in seconds, or None if the file isn't a plain RIFF/WAVE file.
+    """
+    with open(audio_file, 'rb') as f:
+        header = f.read(_CANONICAL_HEADER_SIZE)
+        if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+            return None
+
+        # Fast path: the canonical 44-byte layout written for our PCM
+        # recordings ("fmt " of 16 bytes followed directly by "data")
+        if (len(header) == _CANONICAL_HEADER_SIZE and header[12:16] == b'fmt '
+                and header[36:40] == b'data'):
+            fmt_size, byte_rate = struct.unpack_from('<I8xI', header, 16)
+            data_size = struct.unpack_from('<I', header, 40)[0]
+            if fmt_size == 16 and byte_rate:
+                return data_size / byte_rate
+
+        # General case: walk the chunk list
+        f.seek(12)
+        byte_rate = None
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                return None
+            chunk_id, chunk_size = struct.unpack('<4sI', chunk)
+            padded_size = chunk_size + (chunk_size & 1)
+            if chunk_id == b'fmt ':
+                fmt = f.read(padded_size)
+                byte_rate = struct.unpack_from('<I', fmt, 8)[0]
+            elif chunk_id == b'data':
+                if not byte_rate:
+                    return None
+                return chunk_size / byte_rate
+            else:
+                f.seek(padded_size, os.SEEK_CUR)
+
+
+def _read_entry_bytes(entry: os.DirEntry) -> bytes:
+    """Read a small file in one sized read.
+
+    Args:
+        entry: Directory entry for the file; its cached stat gives the size.
+
+    Returns:
+        The file contents.
+    """
+    fd = os.open(entry.path, os.O_RDONLY)
+    try:
+        # Ask for one byte more than expected so growth since the stat shows
+        size = entry.stat().st_size
+        data = os.read(fd, size + 1)
+        if len(data) <= size:
+            return data
+
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def _probe_duration(audio_file: Path) -> float:
+    """Get the duration of an audio file in seconds.
+
+    Uses the WAV header fast path, falling back to soundfile for anything
+    it can't parse.
+
+    Args:
+        audio_file: Path to the audio file.
+
+    Returns:
+        Duration in seconds, or 0.0 if it can't be determined.
+    """
+    try:
+        duration = _read_wav_duration(audio_file)
+        if duration is not None:
+            return duration
+    except (OSError, struct.error):
+        pass
+
+    if sf is None:
+        return 0.0
+    try:
+        return sf.info(audio_file).duration
+    except Exception:
+        return 0.0
 
 
 class SampleManager:
     """Manages saving and organizing voice training samples."""
 
+    # Per-sample files, named "<number><suffix>" inside the sample folder
+    SAMPLE_FILE_SUFFIXES = (".wav", ".txt", "_metadata.json")
+
+    # Concurrent per-sample loads when reading the whole dataset (I/O bound)
+    LOAD_WORKERS = 32
+
+    # Persisted audio durations, kept beside (not in) the samples dir so
+    # writing it doesn't change the samples dir mtime the caches key on
+    INDEX_FILE_NAME = ".samples_index.json"
+
     def __init__(self, base_path: Path):
         """Initialize sample manager.
 
@@ -17,26 +140,153 @@ class SampleManager:
         self.base_path = base_path
         self.samples_dir = base_path / "samples"
         self.samples_dir.mkdir(parents=True, exist_ok=True)
+        # String form for the scan loops, which work on plain str paths
+        self._samples_dir_str = os.fspath(self.samples_dir)
+
+        # Cached directory scan and get_all_samples() results, keyed on the
+        # samples dir mtime
+        self._scan_cache: Optional[List[int]] = None
+        self._scan_cache_mtime: Optional[int] = None
+        self._samples_cache: Optional[List[dict]] = None
+        self._samples_cache_mtime: Optional[int] = None
+        self._samples_total_seconds: Optional[float] = None
+        # Bumped by invalidate_cache(); a pass that overlapped a write (files
+        # inside a sample folder don't touch the dir mtime) is not cached
+        self._cache_generation = 0
+
+        # Guards the caches and the index; full passes may run on a background
+        # thread while the UI thread reads or scans, and their loader threads
+        # write index entries concurrently
+        self._lock = threading.RLock()
+
+        # sample number -> (audio size, audio mtime_ns, duration)
+        self._index_path = base_path / self.INDEX_FILE_NAME
+        self._index: Dict[int, Tuple[int, int, float]] = self._load_index()
+        self._index_dirty = False
+
+        # Next sample number, advanced by saves and recomputed by renumbering;
+        # refresh() recomputes it from disk
+        self._next_num = 1
+        self.refresh()
+
+    def is_cache_fresh(self) -> bool:
+        """Check whether sample queries can be answered without scanning disk.
 
-    def get_next_sample_number(self) -> int:
-        """Get the next available sample number.
+        Returns:
+            True if cached sample info is current (or there is nothing to scan).
+        """
+        try:
+            mtime = os.stat(self._samples_dir_str).st_mtime_ns
+        except OSError:
+            return True
+        with self._lock:
+            return self._samples_cache is not None and mtime == self._samples_cache_mtime
+
+    def refresh(self):
+        """Rescan the samples directory and recompute the next sample number."""
+        self.invalidate_cache()
+        existing = self._scan()
+        self._next_num = existing[-1] + 1 if existing else 1
+
+    def _load_index(self) -> Dict[int, Tuple[int, int, float]]:
+        """Load the persisted duration index.
 
         Returns:
-            Next sample number (e.g., 1, 2, 3...).
+            Index entries by sample number (empty if missing or unreadable).
+        """
+        try:
+            raw = loads(self._index_path.read_bytes())
+            return {int(num): (int(size), int(mtime), float(duration))
+                    for num, (size, mtime, duration) in raw.items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error loading sample index: {e}")
+            return {}
+
+    def _save_index(self):
+        """Write the duration index to disk atomically if it changed."""
+        with self._lock:
+            if not self._index_dirty:
+                return
+            try:
+                data = {str(num): list(entry) for num, entry in sorted(self._index.items())}
+                with tempfile.NamedTemporaryFile(
+                    'wb', dir=self.base_path, prefix=".samples_index-", suffix=".tmp", delete=False
+                ) as f:
+                    f.write(dumps(data))
+                os.replace(f.name, self._index_path)
+                self._index_dirty = False
+            except Exception as e:
+                print(f"Error saving sample index: {e}")
+
+    def _audio_duration(self, sample_num: int, audio_path: str, st: os.stat_result) -> float:
+        """Get a sample's audio duration, probing the file only if it changed.
+
+        Args:
+            sample_num: Sample number.
+            audio_path: Path to the sample's audio file.
+            st: Stat result for the audio file.
+
+        Returns:
+            Duration in seconds.
         """
-        if not self.samples_dir.exists():
-            return 1
+        with self._lock:
+            entry = self._index.get(sample_num)
+        if entry is not None and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+
+        # Probe outside the lock so loader threads don't serialize on it
+        duration = _probe_duration(audio_path)
+        with self._lock:
+            self._index[sample_num] = (st.st_size, st.st_mtime_ns, duration)
+            self._index_dirty = True
+        return duration
+
+    def invalidate_cache(self):
+        """Drop cached sample information so the next query rescans disk."""
+        with self._lock:
+            self._cache_generation += 1
+            self._scan_cache = None
+            self._scan_cache_mtime = None
+            self._samples_cache = None
+            self._samples_cache_mtime = None
+            self._samples_total_seconds = None
+
+    def _scan(self) -> List[int]:
+        """Get the sorted numbers of all sample folders on disk.
+
+        Returns:
+            Sorted list of sample numbers (cached until the samples dir changes).
+        """
+        try:
+            mtime = os.stat(self._samples_dir_str).st_mtime_ns
+        except OSError:
+            return []
+
+        with self._lock:
+            if self._scan_cache is not None and mtime == self._scan_cache_mtime:
+                return self._scan_cache
 
-        # Find all numeric directories
-        existing = []
-        for item in self.samples_dir.iterdir():
-            if item.is_dir() and item.name.isdigit():
-                existing.append(int(item.name))
+        # DirEntry.is_dir() uses the dirent type, avoiding a stat per entry
+        with os.scandir(self._samples_dir_str) as it:
+            numbers = sorted(
+                int(entry.name) for entry in it
+                if entry.name.isdigit() and entry.is_dir(follow_symlinks=False)
+            )
 
-        if not existing:
-            return 1
+        with self._lock:
+            self._scan_cache = numbers
+            self._scan_cache_mtime = mtime
+        return numbers
+
+    def get_next_sample_number(self) -> int:
+        """Get the next available sample number.
 
-        return max(existing) + 1
+        Returns:
+            Next sample number (e.g., 1, 2, 3...).
+        """
+        return self._next_num
 
     def get_sample_folder(self, sample_num: int) -> Path:
         """Get the folder path for a sample number.
@@ -50,41 +300,121 @@ class SampleManager:
         folder_name = f"{sample_num:03d}"
         return self.samples_dir / folder_name
 
+    def _sample_folder_str(self, sample_num: int) -> str:
+        """Get the folder path for a sample number as a plain string.
+
+        Args:
+            sample_num: Sample number.
+
+        Returns:
+            Path to sample folder.
+        """
+        return os.path.join(self._samples_dir_str, f"{sample_num:03d}")
+
     def save_sample(self, audio_path: Path, text_content: str,
-                    metadata: Optional[dict] = None) -> Tuple[bool, Optional[str]]:
+                    metadata: Optional[dict] = None,
+                    link: bool = False) -> Tuple[bool, Optional[str]]:
         """Save a voice sample with text and optional metadata.
 
         Args:
             audio_path: Path to the audio file (already saved).
             text_content: Text content to save.
             metadata: Optional metadata dictionary.
+            link: Hard-link the audio into place and keep the source file,
+                instead of moving it (falls back to a move if linking fails).
 
         Returns:
             Tuple of (success, error_message).
         """
-        try:
-            # Get next sample number
-            sample_num = self.get_next_sample_number()
-            sample_folder = self.get_sample_folder(sample_num)
+        def place_audio(target_audio: Path):
+            # Move (or link) audio file; rename is metadata-only on the same
+            # filesystem, shutil.move copies only across filesystems
+            if audio_path == target_audio:
+                return
+            if link:
+                try:
+                    os.link(audio_path, target_audio)
+                    return
+                except OSError:
+                    pass
+            try:
+                os.replace(audio_path, target_audio)
+            except OSError:
+                shutil.move(str(audio_path), str(target_audio))
 
-            # Create folder
-            sample_folder.mkdir(parents=True, exist_ok=True)
+        return self._write_sample(place_audio, text_content, metadata)
 
-            # Save text file
-            text_file = sample_folder / f"{sample_num}.txt"
-            text_file.write_text(text_content, encoding='utf-8')
+    def save_sample_from_array(self, audio_data: np.ndarray, sample_rate: int,
+                               text_content: str,
+                               metadata: Optional[dict] = None) -> Tuple[bool, Optional[str]]:
+        """Save a voice sample from in-memory audio with text and optional metadata.
 
-            # Move or copy audio file
-            target_audio = sample_folder / f"{sample_num}.wav"
-            if audio_path != target_audio:
-                import shutil
-                shutil.move(str(audio_path), str(target_audio))
+        The audio is written straight into the sample folder, with no
+        intermediate file.
+
+        Args:
+            audio_data: Audio data to save.
+            sample_rate: Sample rate of the audio in Hz.
+            text_content: Text content to save.
+            metadata: Optional metadata dictionary.
+
+        Returns:
+            Tuple of (success, error_message).
+        """
+        def place_audio(target_audio: Path):
+            if sf is None:
+                raise RuntimeError("soundfile is required to write audio")
+            sf.write(target_audio, audio_data, sample_rate, subtype='PCM_16')
+
+        return self._write_sample(place_audio, text_content, metadata)
 
-            # Save metadata if provided
-            if metadata:
-                metadata_file = sample_folder / f"{sample_num}_metadata.json"
-                with open(metadata_file, 'w') as f:
-                    json.dump(metadata, f, indent=2)
+    def _write_sample(self, place_audio: Callable[[Path], None], text_content: str,
+                      metadata: Optional[dict]) -> Tuple[bool, Optional[str]]:
+        """Create the next sample folder and write its files.
+
+        Args:
+            place_audio: Puts the audio at the target path it is given.
+            text_content: Text content to save.
+            metadata: Optional metadata dictionary.
+
+        Returns:
+            Tuple of (success, error_message).
+        """
+        try:
+            # Claim the next sample number; the folder must be new, so a number
+            # taken behind our back (another writer, a restore) is never reused
+            self.samples_dir.mkdir(parents=True, exist_ok=True)
+            while True:
+                sample_num = self.get_next_sample_number()
+                sample_folder = self.get_sample_folder(sample_num)
+                try:
+                    sample_folder.mkdir()
+                    break
+                except FileExistsError:
+                    # Recompute from disk, stepping past it if it isn't a sample dir
+                    self.refresh()
+                    self._next_num = max(self._next_num, sample_num + 1)
+            self._next_num = sample_num + 1
+
+            try:
+                # Save text file
+                text_file = sample_folder / f"{sample_num}.txt"
+                text_file.write_text(text_content, encoding='utf-8')
+
+                # Save metadata if provided (serialized in memory, one write)
+                if metadata:
+                    metadata_file = sample_folder / f"{sample_num}_metadata.json"
+                    metadata_file.write_bytes(dumps(metadata))
+
+                # Audio goes last, so a failure never leaves a moved take behind
+                place_audio(sample_folder / f"{sample_num}.wav")
+            except Exception:
+                # Don't leave a partial sample for scans to pick up
+                shutil.rmtree(sample_folder, ignore_errors=True)
+                self._next_num = sample_num
+                raise
+            finally:
+                self.invalidate_cache()
 
             return True, None
 
@@ -97,15 +427,7 @@ class SampleManager:
         Returns:
             Number of samples.
         """
-        if not self.samples_dir.exists():
-            return 0
-
-        count = 0
-        for item in self.samples_dir.iterdir():
-            if item.is_dir() and item.name.isdigit():
-                count += 1
-
-        return count
+        return len(self._scan())
 
     def get_sample_info(self, sample_num: int) -> Optional[dict]:
         """Get information about a specific sample.
@@ -116,34 +438,55 @@ class SampleManager:
         Returns:
             Dictionary with sample info or None if not found.
         """
-        folder = self.get_sample_folder(sample_num)
-        if not folder.exists():
-            return None
+        return self._read_sample(sample_num)[0]
+
+    def _read_sample(self, sample_num: int) -> Tuple[Optional[dict], Optional[os.stat_result]]:
+        """Read a sample's info along with the stat result of its audio file.
+
+        Args:
+            sample_num: Sample number.
+
+        Returns:
+            Tuple of (sample info or None if not found, audio stat or None).
+        """
+        folder = self._sample_folder_str(sample_num)
+
+        # One directory read; DirEntry caches its type and stat results
+        try:
+            with os.scandir(folder) as it:
+                entries = {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            return None, None
 
-        audio_file = folder / f"{sample_num}.wav"
-        text_file = folder / f"{sample_num}.txt"
-        metadata_file = folder / f"{sample_num}_metadata.json"
+        audio_entry = entries.get(f"{sample_num}.wav")
+        text_entry = entries.get(f"{sample_num}.txt")
+        metadata_entry = entries.get(f"{sample_num}_metadata.json")
 
         info = {
             'number': sample_num,
-            'folder': str(folder),
-            'has_audio': audio_file.exists(),
-            'has_text': text_file.exists(),
-            'has_metadata': metadata_file.exists()
+            'folder': folder,
+            'has_audio': audio_entry is not None,
+            'has_text': text_entry is not None,
+            'has_metadata': metadata_entry is not None
         }
 
-        if audio_file.exists():
-            info['audio_size'] = audio_file.stat().st_size
-
-        if text_file.exists():
-            info['text_content'] = text_file.read_text(encoding='utf-8')
+        audio_stat = None
+        if audio_entry is not None:
+            audio_stat = audio_entry.stat()
+            info['audio_size'] = audio_stat.st_size
+
+        if text_entry is not None:
+            text = _read_entry_bytes(text_entry).decode('utf-8')
+            if '\r' in text:
+                # Match text-mode reads (e.g. files written on Windows)
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            info['text_content'] = text
             info['text_length'] = len(info['text_content'])
 
-        if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                info['metadata'] = json.load(f)
+        if metadata_entry is not None:
+            info['metadata'] = loads(_read_entry_bytes(metadata_entry))
 
-        return info
+        return info, audio_stat
 
     def estimate_total_duration(self, sample_rate: int = 44100) -> float:
         """Estimate total duration of all samples in minutes.
@@ -154,24 +497,32 @@ class SampleManager:
         Returns:
             Estimated duration in minutes.
         """
-        if not self.samples_dir.exists():
-            return 0.0
-
-        total_seconds = 0.0
-        for item in self.samples_dir.iterdir():
-            if item.is_dir() and item.name.isdigit():
-                sample_num = int(item.name)
-                audio_file = item / f"{sample_num}.wav"
-                if audio_file.exists():
-                    try:
-                        import soundfile as sf
-                        info = sf.info(audio_file)
-                        total_seconds += info.duration
-                    except Exception:
-                        pass
-
+        # Reuse the total from the last complete scan while nothing has changed
+        with self._lock:
+            total_seconds = self._samples_total_seconds if self.is_cache_fresh() else None
+        if total_seconds is None:
+            total_seconds = sum(s.get('duration', 0.0) for s in self.get_all_samples())
         return total_seconds / 60.0
 
+    def get_totals(self, sample_rate: int = 44100) -> Tuple[int, float]:
+        """Get the sample count and total duration from a single pass.
+
+        Args:
+            sample_rate: Sample rate used for recordings.
+
+        Returns:
+            Tuple of (number of samples, total duration in minutes).
+        """
+        with self._lock:
+            fresh = self.is_cache_fresh() and self._samples_cache is not None
+            if fresh:
+                samples = self._samples_cache
+                total_seconds = self._samples_total_seconds
+        if not fresh:
+            samples = self.get_all_samples()
+            total_seconds = sum(s.get('duration', 0.0) for s in samples)
+        return len(samples), total_seconds / 60.0
+
     def create_metadata(self, generation_params: dict) -> dict:
         """Create metadata dictionary for a sample.
 
@@ -186,41 +537,88 @@ class SampleManager:
             'generation_params': generation_params
         }
 
+    def iter_samples(self) -> Iterator[dict]:
+        """Iterate over information about all samples.
+
+        Samples are loaded lazily so callers can start consuming results before
+        the whole directory has been read. When the samples directory is
+        unchanged since the last complete pass, cached results are yielded.
+
+        Yields:
+            Sample info dictionaries, in sample number order.
+        """
+        try:
+            mtime = os.stat(self._samples_dir_str).st_mtime_ns
+        except OSError:
+            return
+
+        with self._lock:
+            cached = self._samples_cache if mtime == self._samples_cache_mtime else None
+            generation = self._cache_generation
+        if cached is not None:
+            yield from cached
+            return
+
+        samples = []
+        numbers = self._scan()
+        if numbers:
+            # Loads are independent, so overlap their file reads; map() still
+            # yields in sample number order
+            workers = min(self.LOAD_WORKERS, len(numbers))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for info in executor.map(self._load_sample, numbers):
+                    if info:
+                        samples.append(info)
+                        yield info
+
+        # Only cache a complete pass that no write invalidated meanwhile
+        with self._lock:
+            if generation == self._cache_generation:
+                self._samples_cache = samples
+                self._samples_cache_mtime = mtime
+                self._samples_total_seconds = sum(s.get('duration', 0.0) for s in samples)
+
+            # Drop index entries for samples that no longer exist, then persist
+            present = set(numbers)
+            for num in [num for num in self._index if num not in present]:
+                del self._index[num]
+                self._index_dirty = True
+            self._save_index()
+
+    def _load_sample(self, sample_num: int) -> Optional[dict]:
+        """Get sample info along with its audio path and duration.
+
+        Args:
+            sample_num: Sample number.
+
+        Returns:
+            Dictionary with sample info or None if not found.
+        """
+        info, audio_stat = self._read_sample(sample_num)
+        if info and audio_stat is not None:
+            audio_file = os.path.join(info['folder'], f"{sample_num}.wav")
+            info['duration'] = self._audio_duration(sample_num, audio_file, audio_stat)
+            info['audio_path'] = audio_file
+        return info
+
     def get_all_samples(self) -> List[dict]:
         """Get information about all samples.
 
         Returns:
             List of sample info dictionaries, sorted by sample number.
         """
-        if not self.samples_dir.exists():
-            return []
+        return list(self.iter_samples())
 
-        samples = []
-        for item in self.samples_dir.iterdir():
-            if item.is_dir() and item.name.isdigit():
-                sample_num = int(item.name)
-                info = self.get_sample_info(sample_num)
-                if info:
-                    # Add audio duration
-                    audio_file = item / f"{sample_num}.wav"
-                    if audio_file.exists():
-                        try:
-                            import soundfile as sf
-                            info_audio = sf.info(audio_file)
-                            info['duration'] = info_audio.duration
-                            info['audio_path'] = str(audio_file)
-                        except Exception:
-                            info['duration'] = 0.0
-                            info['audio_path'] = str(audio_file)
-                    samples.append(info)
-
-        return sorted(samples, key=lambda x: x['number'])
-
-    def delete_sample(self, sample_num: int) -> Tuple[bool, Optional[str]]:
-        """Delete a sample and renumber all subsequent samples.
+    def delete_sample(self, sample_num: int,
+                      renumber: bool = True) -> Tuple[bool, Optional[str]]:
+        """Delete a sample, optionally renumbering the samples after it.
 
         Args:
             sample_num: Sample number to delete.
+            renumber: Close the gap by renumbering later samples (default).
+                When False, only the sample folder is removed and the other
+                numbers stay as they are; call compact() later to close the
+                gaps in one pass.
 
         Returns:
             Tuple of (success, error_message).
@@ -231,44 +629,73 @@ class SampleManager:
                 return False, f"Sample {sample_num} not found"
 
             # Delete the folder
-            import shutil
             shutil.rmtree(folder)
+            self.invalidate_cache()
+            with self._lock:
+                self._index.pop(sample_num, None)
+                self._index_dirty = True
 
-            # Renumber all subsequent samples
-            all_samples = []
-            for item in self.samples_dir.iterdir():
-                if item.is_dir() and item.name.isdigit():
-                    num = int(item.name)
-                    if num > sample_num:
-                        all_samples.append(num)
-
-            # Sort and renumber
-            all_samples.sort()
-            for old_num in all_samples:
-                new_num = old_num - 1
-                old_folder = self.get_sample_folder(old_num)
-                new_folder = self.get_sample_folder(new_num)
-
-                # Rename folder
-                old_folder.rename(new_folder)
-
-                # Rename files inside
-                old_audio = new_folder / f"{old_num}.wav"
-                new_audio = new_folder / f"{new_num}.wav"
-                if old_audio.exists():
-                    old_audio.rename(new_audio)
-
-                old_text = new_folder / f"{old_num}.txt"
-                new_text = new_folder / f"{new_num}.txt"
-                if old_text.exists():
-                    old_text.rename(new_text)
-
-                old_metadata = new_folder / f"{old_num}_metadata.json"
-                new_metadata = new_folder / f"{new_num}_metadata.json"
-                if old_metadata.exists():
-                    old_metadata.rename(new_metadata)
+            if renumber:
+                self._renumber_from(sample_num)
 
+            self._save_index()
             return True, None
 
         except Exception as e:
+            self.refresh()
             return False, str(e)
+
+    def compact(self) -> Tuple[bool, Optional[str]]:
+        """Renumber all samples so their numbers run from 1 without gaps.
+
+        Returns:
+            Tuple of (success, error_message).
+        """
+        try:
+            self._renumber_from(1)
+            self._save_index()
+            return True, None
+
+        except Exception as e:
+            self.refresh()
+            return False, str(e)
+
+    def _renumber_from(self, first_num: int):
+        """Renumber samples numbered first_num and up to be contiguous.
+
+        Args:
+            first_num: Number the first sample at or after it should get.
+        """
+        # Single ascending pass; each target number is always free
+        new_num = first_num
+        for old_num in self._scan():
+            if old_num < first_num:
+                continue
+            if old_num != new_num:
+                # Renames keep file mtimes, so index entries move with them
+                with self._lock:
+                    entry = self._index.pop(old_num, None)
+                    if entry is not None:
+                        self._index[new_num] = entry
+                        self._index_dirty = True
+                new_folder = self._sample_folder_str(new_num)
+                os.rename(self._sample_folder_str(old_num), new_folder)
+
+                # Rename files inside; missing files are simply skipped
+                for suffix in self.SAMPLE_FILE_SUFFIXES:
+                    try:
+                        os.rename(
+                            os.path.join(new_folder, f"{old_num}{suffix}"),
+                            os.path.join(new_folder, f"{new_num}{suffix}"),
+                        )
+                    except FileNotFoundError:
+                        pass
+            new_num += 1
+
+        self.invalidate_cache()
+        if new_num > first_num:
+            self._next_num = new_num
+        else:
+            # Nothing at or after first_num; the highest remaining sample wins
+            existing = self._scan()
+            self._next_num = existing[-1] + 1 if existing else 1
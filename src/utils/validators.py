@@ -1,12 +1,81 @@
 """Validation utilities."""
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict, Any
+import os
+import shutil
+import threading
+import time
 import numpy as np
 
 
+def _longest_run_below_kernel(magnitudes, threshold):
+    """Longest run of values below threshold, in one pass with no temporaries."""
+    longest = 0
+    current = 0
+    for value in magnitudes:
+        if value < threshold:
+            current += 1
+            if current > longest:
+                longest = current
+        else:
+            current = 0
+    return longest
+
+
+def _has_run_below_kernel(samples, threshold, min_run):
+    """Whether |samples| stays below threshold for min_run in a row, stopping at the first hit."""
+    current = 0
+    for value in samples:
+        if abs(value) < threshold:
+            current += 1
+            if current >= min_run:
+                return True
+        else:
+            current = 0
+    return False
+
+
+# numba JIT versions of the kernels above: None until first needed, False if
+# numba is unavailable. numba is imported lazily as it adds noticeably to startup
+_jit_kernels = None
+_jit_lock = threading.Lock()
+
+
+def _get_jit_kernels():
+    """Get the compiled (longest_run_below, has_run_below) kernels.
+
+    Returns:
+        Tuple of jitted kernels, or None if numba is not installed.
+    """
+    global _jit_kernels
+    if _jit_kernels is None:
+        with _jit_lock:
+            if _jit_kernels is None:
+                try:
+                    from numba import njit
+                except ImportError:  # numba is optional; fall back to NumPy
+                    _jit_kernels = False
+                else:
+                    # cache=True keeps compiled code on disk across runs
+                    _jit_kernels = (
+                        njit(cache=True)(_longest_run_below_kernel),
+                        njit(cache=True)(_has_run_below_kernel),
+                    )
+    return _jit_kernels or None
+
+
 class Validators:
     """Collection of validation utilities."""
 
+    # Peak amplitude below which a recording counts as silent
+    SILENT_AMPLITUDE = 0.001
+
+    # Seconds a free-space reading is reused before querying the filesystem again
+    DISK_CACHE_TTL = 2.0
+
+    # Path -> (monotonic time read, free bytes)
+    _disk_free_cache: Dict[str, Tuple[float, int]] = {}
+
     @staticmethod
     def validate_base_path(path: Path) -> Tuple[bool, Optional[str]]:
         """Validate base path for sample storage.
@@ -29,13 +98,18 @@ class Validators:
         if not path.is_dir():
             return False, "Path must be a directory"
 
-        # Test write permissions
-        test_file = path / ".write_test"
-        try:
-            test_file.touch()
-            test_file.unlink()
-        except Exception as e:
-            return False, f"No write permission: {str(e)}"
+        # Test write permissions with a single access() check. Windows ACLs
+        # aren't reflected by access(), so probe with a real file there
+        if os.name != 'nt':
+            if not os.access(path, os.W_OK | os.X_OK):
+                return False, "No write permission"
+        else:
+            test_file = path / ".write_test"
+            try:
+                test_file.touch()
+                test_file.unlink()
+            except Exception as e:
+                return False, f"No write permission: {str(e)}"
 
         return True, None
 
@@ -56,8 +130,8 @@ class Validators:
             return False, "Audio recording is empty"
 
         # Check for silence (very low amplitude throughout)
-        max_amplitude = np.abs(audio_data).max()
-        if max_amplitude < 0.001:
+        max_amplitude = Validators._peak_amplitude(audio_data)
+        if max_amplitude < Validators.SILENT_AMPLITUDE:
             return False, "Audio appears to be silent. Please check your microphone."
 
         return True, None
@@ -72,10 +146,12 @@ class Validators:
         Returns:
             Tuple of (is_valid, error_message).
         """
-        if not text or not text.strip():
+        # Strip once and reuse the result for both checks
+        stripped = text.strip() if text else ""
+        if not stripped:
             return False, "Text content is empty"
 
-        if len(text.strip()) < 10:
+        if len(stripped) < 10:
             return False, "Text is too short (minimum 10 characters)"
 
         return True, None
@@ -115,9 +191,7 @@ class Validators:
             Tuple of (has_space, error_message).
         """
         try:
-            import shutil
-            stat = shutil.disk_usage(path)
-            available_mb = stat.free / (1024 * 1024)
+            available_mb = Validators._free_bytes(path) / (1024 * 1024)
 
             if available_mb < required_mb:
                 return False, f"Insufficient disk space. Available: {available_mb:.1f} MB, Required: {required_mb} MB"
@@ -126,6 +200,38 @@ class Validators:
         except Exception as e:
             return False, f"Cannot check disk space: {str(e)}"
 
+    @staticmethod
+    def _free_bytes(path: Path) -> int:
+        """Get free space for a path, reusing a reading younger than DISK_CACHE_TTL.
+
+        Args:
+            path: Path to check.
+
+        Returns:
+            Free space in bytes.
+        """
+        key = str(path)
+        now = time.monotonic()
+        cached = Validators._disk_free_cache.get(key)
+        if cached is not None and now - cached[0] < Validators.DISK_CACHE_TTL:
+            return cached[1]
+
+        free = shutil.disk_usage(path).free
+        Validators._disk_free_cache[key] = (now, free)
+        return free
+
+    @staticmethod
+    def invalidate_disk_cache(path: Optional[Path] = None):
+        """Forget cached free-space readings, e.g. after writing a sample.
+
+        Args:
+            path: Path whose reading to drop, or None to drop all.
+        """
+        if path is None:
+            Validators._disk_free_cache.clear()
+        else:
+            Validators._disk_free_cache.pop(str(path), None)
+
     @staticmethod
     def detect_clipping(audio_data: np.ndarray, threshold: float = 0.99) -> bool:
         """Detect audio clipping.
@@ -140,8 +246,7 @@ class Validators:
         if audio_data is None or len(audio_data) == 0:
             return False
 
-        max_amplitude = np.abs(audio_data).max()
-        return max_amplitude >= threshold
+        return Validators._peak_amplitude(audio_data) >= threshold
 
     @staticmethod
     def detect_long_silence(audio_data: np.ndarray, threshold: float = 0.01,
@@ -160,20 +265,140 @@ class Validators:
         if audio_data is None or len(audio_data) == 0:
             return False
 
-        # Find silent samples
-        is_silent = np.abs(audio_data) < threshold
-
-        # Count consecutive silent samples
-        max_silent_samples = 0
-        current_silent = 0
-
-        for silent in is_silent:
-            if silent:
-                current_silent += 1
-                max_silent_samples = max(max_silent_samples, current_silent)
+        kernels = _get_jit_kernels()
+        if kernels is not None:
+            # Only a yes/no is needed, so stop at the first long enough run;
+            # mono audio is scanned directly without an abs() temporary
+            if audio_data.ndim == 1 or audio_data.shape[1] == 1:
+                samples = np.ascontiguousarray(audio_data).reshape(-1)
             else:
-                current_silent = 0
+                samples = Validators._frame_magnitudes(audio_data)
+            return bool(kernels[1](samples, threshold, min_duration * sample_rate))
+
+        magnitudes = Validators._frame_magnitudes(audio_data)
+        max_silent_samples = Validators._longest_run_below(magnitudes, threshold)
 
         # Convert to seconds
         max_silent_duration = max_silent_samples / sample_rate
         return max_silent_duration >= min_duration
+
+    @staticmethod
+    def quality_scan(audio_data: np.ndarray, sample_rate: int = 44100,
+                     clip_threshold: float = 0.99, silence_threshold: float = 0.01,
+                     min_silence: float = 3.0) -> Tuple[bool, bool]:
+        """Check audio for clipping and long silence from one magnitude pass.
+
+        Args:
+            audio_data: Audio data to check.
+            sample_rate: Sample rate of audio.
+            clip_threshold: Clipping threshold (0.0 to 1.0).
+            silence_threshold: Silence threshold.
+            min_silence: Minimum silence duration in seconds to report.
+
+        Returns:
+            Tuple of (clipping_detected, long_silence_detected).
+        """
+        stats = Validators.analyze_audio(
+            audio_data, sample_rate, clip_threshold, silence_threshold, min_silence
+        )
+        return stats['clipping'], stats['long_silence']
+
+    @staticmethod
+    def analyze_audio(audio_data: Optional[np.ndarray], sample_rate: int = 44100,
+                      clip_threshold: float = 0.99, silence_threshold: float = 0.01,
+                      min_silence: float = 3.0) -> Dict[str, Any]:
+        """Run the audio validity, clipping and silence checks from one magnitude pass.
+
+        Args:
+            audio_data: Audio data to check.
+            sample_rate: Sample rate of audio.
+            clip_threshold: Clipping threshold (0.0 to 1.0).
+            silence_threshold: Silence threshold.
+            min_silence: Minimum silence duration in seconds to report.
+
+        Returns:
+            Dictionary with 'empty', 'max_amplitude', 'silent' (peak under
+            SILENT_AMPLITUDE), 'clipping' and 'long_silence'.
+        """
+        if audio_data is None or len(audio_data) == 0:
+            return {
+                'empty': True,
+                'max_amplitude': 0.0,
+                'silent': True,
+                'clipping': False,
+                'long_silence': False,
+            }
+
+        magnitudes = Validators._frame_magnitudes(audio_data)
+        max_amplitude = float(magnitudes.max())
+        max_silent_samples = Validators._longest_run_below(magnitudes, silence_threshold)
+        return {
+            'empty': False,
+            'max_amplitude': max_amplitude,
+            'silent': max_amplitude < Validators.SILENT_AMPLITUDE,
+            'clipping': max_amplitude >= clip_threshold,
+            'long_silence': max_silent_samples / sample_rate >= min_silence,
+        }
+
+    @staticmethod
+    def warm_up():
+        """Import numba and compile (or load cached) audio kernels ahead of first use.
+
+        Meant to run on a background thread at startup so the first
+        finished take isn't delayed by JIT compilation.
+        """
+        kernels = _get_jit_kernels()
+        if kernels is None:
+            return
+        for dtype in (np.float32, np.float64):
+            probe = np.zeros(4, dtype=dtype)
+            kernels[0](probe, 0.01)
+            kernels[1](probe, 0.01, 2.0)
+
+    @staticmethod
+    def _peak_amplitude(audio_data: np.ndarray) -> float:
+        """Get the peak absolute amplitude without materializing np.abs(audio_data).
+
+        Args:
+            audio_data: Non-empty audio data.
+
+        Returns:
+            Largest absolute sample value.
+        """
+        # Two streaming reductions instead of a full-size temporary plus a third pass
+        return max(float(audio_data.max()), -float(audio_data.min()))
+
+    @staticmethod
+    def _frame_magnitudes(audio_data: np.ndarray) -> np.ndarray:
+        """Get the peak absolute amplitude of each frame.
+
+        Args:
+            audio_data: Audio data, shaped (frames,) or (frames, channels).
+
+        Returns:
+            1-D array of per-frame magnitudes.
+        """
+        magnitudes = np.abs(audio_data)
+        if magnitudes.ndim > 1:
+            magnitudes = magnitudes.max(axis=1)
+        return magnitudes
+
+    @staticmethod
+    def _longest_run_below(magnitudes: np.ndarray, threshold: float) -> int:
+        """Get the length of the longest run of frames below a threshold.
+
+        Args:
+            magnitudes: 1-D array of per-frame magnitudes.
+            threshold: Threshold a frame must stay under to count.
+
+        Returns:
+            Longest run length in frames.
+        """
+        kernels = _get_jit_kernels()
+        if kernels is not None:
+            return int(kernels[0](magnitudes, threshold))
+
+        # Runs are the gaps between frames at or above the threshold
+        loud = np.flatnonzero(magnitudes >= threshold)
+        bounds = np.concatenate(([-1], loud, [len(magnitudes)]))
+        return int((np.diff(bounds) - 1).max())